@@ -0,0 +1,36 @@
+# the result cache on skewed traffic: codes are drawn from a Zipf-like distribution
+# (a few popular codes, a long tail), decoded with and without a cache of a few sizes
+# usage: python benchmarks/cache.py [lookups] [distinct codes]
+
+import os
+import sys
+import time
+import random
+import itertools
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ggworkshop import codec, cache
+
+def run(decode, codes):
+	start = time.perf_counter()
+	for code in codes:
+		decode('nes', code)
+	return len(codes) / (time.perf_counter() - start)
+
+if __name__ == '__main__':
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+	distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+	random.seed(0)
+
+	population = [''.join(random.choice(codec.NES_ALPHABET) for i in range(random.choice((6, 8)))) for j in range(distinct)]
+	weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(distinct)))
+	codes = random.choices(population, cum_weights = weights, k = count)
+
+	print('{0:<16} {1:>12} {2:>9} {3:>10}'.format('cache size', 'codes/s', 'hit rate', 'evictions'))
+	print('{0:<16} {1:12.0f}'.format('none', run(codec.decode, codes)))
+	for size in (1000, 10000, 65536):
+		results = cache.Cache(size)
+		speed = run(results.decode, codes)
+		stats = results.stats()
+		print('{0:<16} {1:12.0f} {2:8.1%} {3:10}'.format(size, speed, stats['hit_rate'], stats['evictions']))
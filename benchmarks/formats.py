@@ -0,0 +1,25 @@
+# how fast each output format is written, rows are decoded once up front and written to /dev/null
+# usage: python benchmarks/formats.py [codes]
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ggworkshop import batch, codec
+
+if __name__ == '__main__':
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+	random.seed(0)
+
+	lines = [''.join(random.choice(codec.NES_ALPHABET) for i in range(random.choice((6, 8)))) for j in range(count)]
+	rows = list(batch.process('nes', lines))
+
+	for name in ('csv', 'json', 'bin'):
+		with open(os.devnull, 'wb' if name in batch.BINARY else 'w') as out:
+			start = time.perf_counter()
+			batch.WRITERS[name](rows, out)
+			elapsed = time.perf_counter() - start
+		print('{0:<6} {1:10.0f} rows/s'.format(name, count / elapsed))
@@ -0,0 +1,215 @@
+# golden vectors: the whole 6-letter NES and 6-digit GB/Game Gear code spaces (and a fixed sample
+# of 8-letter/9-digit codes) decoded and encoded, checked against SHA-256 digests in golden.json
+#
+# the digests are made by --update from the reference decoders below, which move the bits around
+# letter by letter like the very first version of GGWorkshop did, so they don't share any code with
+# the codec they check
+#
+# checks:
+# codec   the integer functions (nes_decode6(), gb_encode6()...) over every code / address and value
+# api     codec.decode()/encode() on every code string, with flags (and the lookup tables, if installed)
+# tables  the lookup table file, if it was built
+# vector  the NumPy codec, if NumPy is installed
+#
+# usage: python benchmarks/golden.py [check...] [--update]
+
+import os
+import sys
+import json
+import time
+import array
+import random
+import hashlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ggworkshop import codec, tables
+
+GOLDEN = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden.json')
+CHECKS = ('codec', 'api', 'tables', 'vector')
+
+SAMPLE = 1 << 20 # 8-letter/9-digit codes
+SEED = 0x6767
+
+# spelled out here instead of taken from the codec
+NES_LETTERS = 'APZLGITYEOXUKSVN'
+HEX_DIGITS = '0123456789ABCDEF'
+NES_PAIRS = [a + b for a in NES_LETTERS for b in NES_LETTERS]
+HEX_PAIRS = [a + b for a in HEX_DIGITS for b in HEX_DIGITS]
+
+def _bits(n, length):
+	return [format(n >> (length - 1 - i) * 4 & 15, '04b') for i in range(length)]
+
+def _flip(bit):
+	return '1' if bit == '0' else '0'
+
+# address << 8 | value, or address << 16 | condition << 8 | value
+def reference_nes(n, length):
+	bits = _bits(n, length)
+	rows = ['1' + bits[3][1:], bits[4][0] + bits[5][1:], bits[1][0] + bits[2][1:], bits[3][0] + bits[4][1:]]
+	if length == 6: rows += [bits[0][0] + bits[1][1:], bits[5][0] + bits[0][1:]]
+	else: rows += [bits[6][0] + bits[7][1:], bits[5][0] + bits[6][1:], bits[0][0] + bits[1][1:], bits[7][0] + bits[0][1:]]
+
+	return int(''.join(rows), 2)
+
+# the same, plus 1 << 32 if a 9-digit code fails the 8th character check
+def reference_gb(n, length):
+	bits = _bits(n, length)
+	rows = [''.join(map(_flip, bits[5])), bits[2], bits[3], bits[4]]
+	invalid = 0
+	if length == 9:
+		six, eight = bits[6], bits[8]
+		rows += [_flip(eight[2]) + eight[3] + _flip(six[0]) + _flip(six[1]), _flip(six[2]) + six[3] + _flip(eight[0]) + eight[1]]
+		if bits[7] != _flip(six[0]) + six[1:]: invalid = 1 << 32
+	rows += [bits[0], bits[1]]
+
+	return int(''.join(rows), 2) | invalid
+
+def sample(bits):
+	rng = random.Random(SEED)
+	return [rng.getrandbits(bits) for i in range(SAMPLE)]
+
+def digest(values, typecode = 'I'):
+	if not isinstance(values, (array.array, memoryview)): values = array.array(typecode, values)
+	if isinstance(values, array.array) and sys.byteorder == 'big':
+		values = array.array(values.typecode, values)
+		values.byteswap()
+
+	return hashlib.sha256(values).hexdigest()
+
+# every name in golden.json, made from the reference decoders
+def reference():
+	vectors = {}
+
+	decoded = array.array('I', (reference_nes(n, 6) for n in range(1 << 24)))
+	vectors['nes6'] = digest(decoded)
+	# the encoder gives the code with the third letter's high bit clear
+	encoded = array.array('I', bytes(4 << 23))
+	for n, key in enumerate(decoded):
+		if not n & 0x8000: encoded[(key >> 8 & 0x7FFF) << 8 | key & 255] = n
+	vectors['nes6enc'] = digest(encoded)
+
+	decoded = array.array('I', (reference_gb(n, 6) for n in range(1 << 24)))
+	vectors['gb6'] = digest(decoded)
+	encoded = array.array('I', bytes(4 << 24))
+	for n, key in enumerate(decoded):
+		encoded[key] = n
+	vectors['gb6enc'] = digest(encoded)
+
+	vectors['nes8'] = digest((reference_nes(n, 8) for n in sample(32)), 'Q')
+	vectors['gb9'] = digest((reference_gb(n, 9) for n in sample(36)), 'Q')
+
+	return vectors
+
+def check_codec(golden):
+	failed = []
+	for name in ('nes6', 'nes6enc', 'gb6', 'gb6enc'):
+		if digest(tables._generate(name)) != golden[name]: failed.append(name)
+
+	if digest((codec.nes_decode8(n) for n in sample(32)), 'Q') != golden['nes8']: failed.append('nes8')
+	gb9 = (codec.gb_decode9(n) | (n != codec.gb_fix9(n)) << 32 for n in sample(36))
+	if digest(gb9, 'Q') != golden['gb9']: failed.append('gb9')
+
+	return failed
+
+def check_api(golden):
+	failed = []
+	nes = codec.get('nes')
+	for platform, pairs, name in (('nes', NES_PAIRS, 'nes6'), ('gb', HEX_PAIRS, 'gb6'), ('gear', HEX_PAIRS, 'gb6')):
+		decode = codec.get(platform).decode
+		ram = codec.GB_ROM_DIGIT.get(platform)
+		decoded = array.array('I', bytes(4 << 24))
+		for n in range(1 << 24):
+			result = decode(pairs[n >> 16] + pairs[n >> 8 & 255] + pairs[n & 255])
+			# only GB/Game Gear codes with a low 6th digit are RAM codes, 6-character codes are never invalid
+			if result.n != n or result.condition is not None or result.flags != (codec.RAM if ram is not None and (n & 15) < ram else 0):
+				failed.append('{0} {1:06X}'.format(platform, n))
+				break
+			decoded[n] = result.address << 8 | result.value
+		if digest(decoded) != golden[name]: failed.append(platform + ' decode')
+
+	encoded = array.array('I', (nes.encode(0x8000 | key >> 8, key & 255).n for key in range(1 << 23)))
+	if digest(encoded) != golden['nes6enc']: failed.append('nes encode')
+	for platform in ('gb', 'gear'):
+		encode = codec.get(platform).encode
+		encoded = array.array('I', (encode(key >> 8, key & 255).n for key in range(1 << 24)))
+		if digest(encoded) != golden['gb6enc']: failed.append(platform + ' encode')
+
+	codes = sample(32)
+	if digest((result.address << 16 | result.condition << 8 | result.value for result in map(nes.decode, (NES_PAIRS[n >> 24] + NES_PAIRS[n >> 16 & 255] + NES_PAIRS[n >> 8 & 255] + NES_PAIRS[n & 255] for n in codes))), 'Q') != golden['nes8']: failed.append('nes 8 letters')
+	gb = codec.get('gb').decode
+	codes = ('{0:09X}'.format(n) for n in sample(36))
+	if digest((result.address << 16 | result.condition << 8 | result.value | result.invalid << 32 for result in map(gb, codes)), 'Q') != golden['gb9']: failed.append('gb 9 digits')
+
+	return failed
+
+def check_tables(golden):
+	found = tables.load()
+	if found is None: return None
+
+	return [name for name in ('nes6', 'nes6enc', 'gb6', 'gb6enc') if digest(getattr(found, name)) != golden[name]]
+
+def check_vector(golden):
+	try: import numpy as np
+	except ImportError: return None
+	from ggworkshop import vector
+
+	failed = []
+	chunk = 1 << 20
+	for platform, pairs, name in (('nes', NES_PAIRS, 'nes6'), ('gb', HEX_PAIRS, 'gb6')):
+		pairs = np.array(pairs, 'S2').view(np.uint16)
+		decoded = np.empty(1 << 24, np.uint32)
+		for start in range(0, 1 << 24, chunk):
+			n = np.arange(start, start + chunk, dtype = np.uint32)
+			codes = np.stack([pairs[n >> 16], pairs[n >> 8 & 255], pairs[n & 255]], 1).view('S6').ravel()
+			result = vector.decode(platform, codes)
+			if not result['valid'].all() or result['invalid'].any() or (result['condition'] != -1).any():
+				failed.append(platform + ' flags')
+				break
+			decoded[start:start + chunk] = result['address'] << 8 | result['value']
+		if digest(memoryview(decoded)) != golden[name]: failed.append(platform + ' decode')
+
+	# encoded codes are turned back into numbers with the letters spelled out above
+	for platform, letters, columns, size, high, name in (('nes', NES_LETTERS, (0, 1, 2, 3, 4, 5), 1 << 23, 0x8000, 'nes6enc'), ('gb', HEX_DIGITS, (0, 1, 2, 4, 5, 6), 1 << 24, 0, 'gb6enc')):
+		lookup = np.zeros(256, np.uint32)
+		lookup[np.frombuffer(letters.encode(), np.uint8)] = np.arange(16, dtype = np.uint32)
+		encoded = np.empty(size, np.uint32)
+		for start in range(0, size, chunk):
+			keys = np.arange(start, start + chunk, dtype = np.uint32)
+			raw = np.ascontiguousarray(vector.encode(platform, keys >> 8 | high, keys & 255)['code']).view(np.uint8).reshape(-1, 11)
+			n = np.zeros(chunk, np.uint32)
+			for column in columns:
+				n = n << 4 | lookup[raw[:, column]]
+			encoded[start:start + chunk] = n
+		if digest(memoryview(encoded)) != golden[name]: failed.append(platform + ' encode')
+
+	return failed
+
+if __name__ == '__main__':
+	args = sys.argv[1:]
+	if '--update' in args:
+		print('Decoding both code spaces with the reference decoders, this takes a few minutes...')
+		with open(GOLDEN, 'w') as f:
+			json.dump(reference(), f, indent = '\t', sort_keys = True)
+			f.write('\n')
+		print('Saved to ' + GOLDEN)
+		sys.exit()
+
+	for name in args:
+		if name not in CHECKS: sys.exit('unknown check: {0} (checks: {1})'.format(name, ', '.join(CHECKS)))
+
+	with open(GOLDEN) as f:
+		golden = json.load(f)
+
+	status = 0
+	for name in args or CHECKS:
+		start = time.perf_counter()
+		failed = globals()['check_' + name](golden)
+		elapsed = time.perf_counter() - start
+		if failed is None: print('{0:<8} skipped'.format(name))
+		elif failed:
+			print('{0:<8} FAILED: {1}'.format(name, ', '.join(failed)))
+			status = 1
+		else: print('{0:<8} OK ({1:.1f} s)'.format(name, elapsed))
+
+	sys.exit(status)
@@ -0,0 +1,63 @@
+# how long `import ggworkshop` and a one-code CLI run take on top of a bare interpreter start,
+# and what -X importtime says our own modules cost
+# with a limit (in ms), exits with 1 if `python -m ggworkshop` takes longer than that on top of
+# the bare interpreter, for running in CI
+# usage: python benchmarks/import_time.py [runs] [limit]
+
+import os
+import sys
+import time
+import subprocess
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# measure with cached bytecode like a normal install would have
+env = dict(os.environ)
+env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+def best(argv, runs):
+	subprocess.run(argv, cwd = root, env = env, check = True, stdout = subprocess.DEVNULL)
+	times = []
+	for i in range(runs):
+		start = time.perf_counter()
+		subprocess.run(argv, cwd = root, env = env, check = True, stdout = subprocess.DEVNULL)
+		times.append(time.perf_counter() - start)
+
+	return min(times)
+
+def import_times(argv):
+	# the "self" column of -X importtime, in microseconds
+	out = subprocess.run([sys.executable, '-X', 'importtime'] + argv, cwd = root, env = env, check = True, capture_output = True, text = True).stderr
+	times = {}
+	for line in out.splitlines():
+		fields = line.split('|')
+		if len(fields) == 3 and fields[0].split(':')[1].strip().isdigit():
+			times[fields[2].strip()] = int(fields[0].split(':')[1])
+
+	return times
+
+def self_time(argv):
+	# our own modules only
+	return sum(time for module, time in import_times(argv).items() if module.startswith('ggworkshop'))
+
+# what a script calling GGWorkshop once per code runs
+FAST = ['-m', 'ggworkshop', 'decode', 'nes', 'WALNUT', '-f', 'csv']
+MAIN = ['main.py', 'decode', 'nes', 'WALNUT', '-H', '-f', 'csv']
+
+if __name__ == '__main__':
+	runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+	limit = float(sys.argv[2]) if len(sys.argv) > 2 else None
+
+	bare = best([sys.executable, '-c', 'pass'], runs)
+	print('{0:<36} {1:8.2f} ms'.format('bare interpreter', bare * 1000))
+	for name, argv in (('import ggworkshop', ['-c', 'import ggworkshop']), ('python -m ggworkshop decode -f csv', FAST), ('python main.py decode -H -f csv', MAIN)):
+		elapsed = best([sys.executable] + argv, runs)
+		print('{0:<36} {1:8.2f} ms (+{2:.2f} ms, -X importtime of ggworkshop: {3:.2f} ms)'.format(name, elapsed * 1000, (elapsed - bare) * 1000, self_time(argv) / 1000))
+		if argv is FAST: fast = elapsed - bare
+
+	print('\nslowest imports of python -m ggworkshop decode -f csv (self):')
+	for module, time in sorted(import_times(FAST).items(), key = lambda item: -item[1])[:8]:
+		print('  {0:<32} {1:8.2f} ms'.format(module, time / 1000))
+
+	if limit is not None and fast * 1000 > limit:
+		sys.exit('python -m ggworkshop takes {0:.2f} ms on top of the interpreter, more than {1} ms'.format(fast * 1000, limit))
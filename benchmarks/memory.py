@@ -0,0 +1,54 @@
+# memory per decoded result kept around, measured with tracemalloc over a list of results
+# (the list itself is not counted); OldResult is what DecodeResult used to be, an object with
+# a __dict__ and the code/hex strings made up front
+# usage: python benchmarks/memory.py [codes]
+
+import os
+import sys
+import random
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ggworkshop import codec
+
+class OldResult(object):
+	def __init__(self, platform, code, address, value, condition = None, invalid = False, replacement = None, ram = False):
+		self.platform = platform
+		self.code = code
+		self.address = address
+		self.value = value
+		self.condition = condition
+		self.invalid = invalid
+		self.replacement = replacement
+		self.ram = ram
+
+def old(platform, code):
+	result = codec.decode(platform, code)
+	return OldResult(platform, result.code, result.address, result.value, result.condition, result.invalid, result.replacement, result.ram)
+
+def measure(func, platform, codes):
+	results = [None] * len(codes)
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	for i, code in enumerate(codes):
+		results[i] = func(platform, code)
+	used = tracemalloc.get_traced_memory()[0] - before
+	tracemalloc.stop()
+
+	return used / len(codes)
+
+if __name__ == '__main__':
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+	random.seed(0)
+
+	jobs = (
+		('NES 6 letters', 'nes', [''.join(random.choice(codec.NES_ALPHABET) for i in range(6)) for j in range(count)]),
+		('NES 8 letters', 'nes', [''.join(random.choice(codec.NES_ALPHABET) for i in range(8)) for j in range(count)]),
+		('GB 9 digits', 'gb', ['{0:09X}'.format(random.getrandbits(36)) for j in range(count)]),
+		('Mega Drive', 'mega', [''.join(random.choice(codec.MEGA_ALPHABET) for i in range(8)) for j in range(count)])
+	)
+
+	print('{0:<16} {1:>14} {2:>14}'.format('', 'old, bytes', 'now, bytes'))
+	for name, platform, codes in jobs:
+		print('{0:<16} {1:14.0f} {2:14.0f}'.format(name, measure(old, platform, codes), measure(codec.decode, platform, codes)))
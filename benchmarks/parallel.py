@@ -0,0 +1,37 @@
+# throughput of the process pool for 1..N workers
+# usage: python benchmarks/parallel.py [codes] [max workers]
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ggworkshop import batch, codec, parallel
+
+def rate(count, func, *args):
+	start = time.perf_counter()
+	for row in func(*args): pass
+	return count / (time.perf_counter() - start)
+
+if __name__ == '__main__':
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 400000
+	workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+	random.seed(0)
+
+	lines = [''.join(random.choice(codec.NES_ALPHABET) for i in range(random.choice((6, 8)))) for j in range(count)]
+	addresses = 64 # $8000-$803F, every value and condition = 4M codes
+
+	base = rate(count, batch.process, 'nes', lines)
+	print('batch decode, 1 process (no pool): {0:10.0f} codes/s'.format(base))
+	for jobs in range(1, workers + 1):
+		speed = rate(count, parallel.process, 'nes', lines, jobs)
+		print('batch decode, {0} workers:          {1:10.0f} codes/s  {2:5.2f}x'.format(jobs, speed, speed / base))
+
+	total = addresses * 256 * 256
+	first = None
+	for jobs in range(1, workers + 1):
+		speed = rate(total, parallel.encode_space, 'nes', 0x8000, 0x8000 + addresses - 1, True, jobs)
+		first = first or speed
+		print('NES 8-letter encode, {0} workers:   {1:10.0f} codes/s  {2:5.2f}x'.format(jobs, speed, speed / first))
@@ -0,0 +1,70 @@
+# exhaustive round trip of the GB/Game Gear codec: encode(decode(x)) == x for all 2^24 6-digit codes,
+# plus every condition (and a random sample of the rest) for 9-digit codes,
+# and a random sample of SNES and Mega Drive codes
+# usage: python benchmarks/roundtrip.py [9-digit samples]
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ggworkshop import codec
+
+def six():
+	decode = codec.gb_decode6
+	encode = codec.gb_encode6
+	for n in range(1 << 24):
+		decoded = decode(n)
+		if encode(decoded >> 8, decoded & 255) != n:
+			return n
+
+def nine(samples):
+	# the 8th digit only has to pass the check, encoding always gives the fixed code
+	for condition in range(256):
+		for n in (codec.gb_encode9(0x1234, 0x56, condition), codec.gb_encode9(0xFEDC, 0xBA, condition)):
+			decoded = codec.gb_decode9(n)
+			if decoded >> 8 & 255 != condition or codec.gb_encode9(decoded >> 16, decoded & 255, decoded >> 8 & 255) != n:
+				return n
+
+	for i in range(samples):
+		n = random.getrandbits(36)
+		decoded = codec.gb_decode9(n)
+		if codec.gb_encode9(decoded >> 16, decoded & 255, decoded >> 8 & 255) != codec.gb_fix9(n):
+			return n
+
+if __name__ == '__main__':
+	samples = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+	start = time.perf_counter()
+	failed = six()
+	elapsed = time.perf_counter() - start
+	if failed is not None:
+		sys.exit('6-digit round trip FAILED for {0:06X}'.format(failed))
+	print('6-digit round trip OK ({0} codes, {1:.0f} codes/s)'.format(1 << 24, (1 << 24) / elapsed))
+
+	failed = nine(samples)
+	if failed is not None:
+		sys.exit('9-digit round trip FAILED for {0:09X}'.format(failed))
+	print('9-digit round trip OK (every condition + {0} random codes)'.format(samples))
+
+	# and once through the public API, dashes and all
+	for platform in ('gb', 'gear'):
+		for i in range(samples // 10):
+			address, value = random.getrandbits(16), random.getrandbits(8)
+			condition = random.choice((None, random.getrandbits(8)))
+			result = codec.decode(platform, codec.encode(platform, address, value, condition).code)
+			if (result.address, result.value, result.condition, result.invalid) != (address, value, condition, False):
+				sys.exit('{0} round trip FAILED for {1:04X} {2:02X} {3}'.format(platform, address, value, condition))
+	print('decode(encode()) OK for gb and gear')
+
+	for platform in ('snes', 'mega'):
+		shift = codec.VALUE_DIGITS[platform] * 4
+		for i in range(samples // 10):
+			# Mega Drive addresses stop at $3FFFFF
+			n = random.randint(0, codec.get(platform).last_address) << shift | random.getrandbits(shift)
+			result = codec.decode(platform, codec.encode(platform, n >> shift, n & (1 << shift) - 1).code)
+			if result.address << shift | result.value != n:
+				sys.exit('{0} round trip FAILED for {1:X}'.format(platform, n))
+	print('decode(encode()) OK for snes and mega')
@@ -0,0 +1,93 @@
+# load generator for the decode/encode service: starts python -m ggworkshop.server on a free
+# localhost port and hits it from several keep-alive connections, each with a few pipelined requests
+# usage: python benchmarks/serve.py [requests] [connections] [pipeline depth]
+
+import os
+import sys
+import json
+import time
+import socket
+import random
+import asyncio
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ggworkshop import codec
+
+def free_port():
+	with socket.socket() as sock:
+		sock.bind(('127.0.0.1', 0))
+		return sock.getsockname()[1]
+
+def start(port):
+	server = subprocess.Popen([sys.executable, '-m', 'ggworkshop.server', '127.0.0.1:{0}'.format(port)], cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__))), stdout = subprocess.DEVNULL)
+	for i in range(200):
+		try:
+			socket.create_connection(('127.0.0.1', port), 0.1).close()
+			return server
+		except OSError: time.sleep(0.05)
+
+	server.kill()
+	sys.exit('the server didn\'t start')
+
+def request(path, payload):
+	body = json.dumps(payload).encode()
+	return 'POST {0} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\nContent-Length: {1}\r\n\r\n'.format(path, len(body)).encode() + body
+
+async def read_response(reader):
+	length = 0
+	while True:
+		line = await reader.readline()
+		if line == b'\r\n': break
+		if line.lower().startswith(b'content-length:'): length = int(line[15:])
+	return await reader.readexactly(length)
+
+async def client(port, requests, count, depth, latencies):
+	reader, writer = await asyncio.open_connection('127.0.0.1', port)
+	for first in range(0, count, depth):
+		sent = []
+		for i in range(first, min(first + depth, count)):
+			writer.write(requests[i % len(requests)])
+			sent.append(time.perf_counter())
+		await writer.drain()
+		for start in sent:
+			await read_response(reader)
+			latencies.append(time.perf_counter() - start)
+	writer.close()
+
+async def run(port, requests, count, connections, depth):
+	latencies = []
+	start = time.perf_counter()
+	await asyncio.gather(*(client(port, requests, count // connections, depth, latencies) for i in range(connections)))
+	return time.perf_counter() - start, sorted(latencies)
+
+def percentile(latencies, p):
+	return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+if __name__ == '__main__':
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+	connections = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+	depth = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+	random.seed(0)
+
+	nes = [''.join(random.choice(codec.NES_ALPHABET) for i in range(6)) for j in range(1000)]
+	jobs = (
+		('decode, 1 code', 1, [request('/decode', {'platform': 'nes', 'code': code}) for code in nes]),
+		('decode auto, 1 code', 1, [request('/decode', {'platform': 'auto', 'code': code}) for code in nes]),
+		('encode, 1 code', 1, [request('/encode', {'platform': 'gb', 'address': '{0:04X}'.format(random.getrandbits(16)), 'value': '{0:02X}'.format(random.getrandbits(8))}) for i in range(1000)]),
+		('decode, 100 codes', 100, [request('/decode', {'platform': 'nes', 'codes': nes[i:i + 100]}) for i in range(0, 1000, 100)])
+	)
+
+	port = free_port()
+	server = start(port)
+	try:
+		print('{0} connections, {1} pipelined requests each\n'.format(connections, depth))
+		print('{0:<22} {1:>10} {2:>12} {3:>9} {4:>9}'.format('', 'requests/s', 'codes/s', 'p50 ms', 'p99 ms'))
+		for name, size, requests in jobs:
+			total = count // size if size > 1 else count
+			elapsed, latencies = asyncio.run(run(port, requests, total, connections, depth))
+			print('{0:<22} {1:10.0f} {2:12.0f} {3:9.2f} {4:9.2f}'.format(name, len(latencies) / elapsed, len(latencies) * size / elapsed, percentile(latencies, 0.5), percentile(latencies, 0.99)))
+	finally:
+		server.terminate()
+		server.wait()
@@ -0,0 +1,128 @@
+# the codec hot paths in one go: single-code latency, batch throughput, CLI cold start and peak
+# memory of a large batch, all with timeit/tracemalloc so it runs offline with nothing installed
+# save a run with --save and compare a later one against it with --compare, which exits with 1
+# if anything got slower (or bigger) by more than --threshold
+# correctness is checked separately by benchmarks/golden.py
+# usage: python benchmarks/suite.py [--quick] [--save <file>] [--compare <file>] [--threshold <fraction>]
+
+import os
+import sys
+import json
+import time
+import random
+import timeit
+import argparse
+import subprocess
+import tracemalloc
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from ggworkshop import batch, codec
+
+# lower is better for every unit except codes/s
+HIGHER = {'codes/s'}
+
+def codes(kind, count):
+	rng = random.Random(kind)
+	if kind == 'nes6' or kind == 'nes8': return [''.join(rng.choice(codec.NES_ALPHABET) for i in range(int(kind[3]))) for j in range(count)]
+	elif kind == 'gb6': return ['{0:06X}'.format(rng.getrandbits(24)) for j in range(count)]
+	elif kind == 'gb9': return ['{0:09X}'.format(rng.getrandbits(36)) for j in range(count)]
+
+def latency(repeat):
+	calls = (
+		('decode nes 6', lambda: codec.decode('nes', 'SXIOPO')),
+		('decode nes 8', lambda: codec.decode('nes', 'SXIOPOZA')),
+		('decode gb 6', lambda: codec.decode('gb', '00A-17B')),
+		('decode gb 9', lambda: codec.decode('gb', '00A-17B-C49')),
+		('decode snes', lambda: codec.decode('snes', 'DD32-6DAD')),
+		('decode mega', lambda: codec.decode('mega', 'GTAS-9EAA')),
+		('encode nes 6', lambda: codec.encode('nes', 0x91D9, 0xAD)),
+		('encode nes 8', lambda: codec.encode('nes', 0x91D9, 0xAD, 0x0A)),
+		('encode gb 6', lambda: codec.encode('gb', 0xA17B, 0x00)),
+		('encode gb 9', lambda: codec.encode('gb', 0xA17B, 0x00, 0xC4))
+	)
+
+	for name, call in calls:
+		timer = timeit.Timer(call)
+		number = timer.autorange()[0]
+		yield name, min(timer.repeat(repeat, number)) / number * 1e6, 'us'
+
+def throughput(count, repeat):
+	for kind in ('nes6', 'nes8', 'gb6', 'gb9'):
+		lines = codes(kind, count)
+		platform = kind[:-1]
+		elapsed = min(timeit.repeat(lambda: sum(1 for row in batch.process(platform, lines)), number = 1, repeat = repeat))
+		yield 'batch ' + kind, count / elapsed, 'codes/s'
+
+def cold_start(runs):
+	# with cached bytecode, like a normal install
+	env = dict(os.environ)
+	env.pop('PYTHONDONTWRITEBYTECODE', None)
+	commands = (
+		('cli decode', [os.path.join(root, 'main.py'), 'decode', 'nes', 'SXIOPO', '-H', '-f', 'csv']),
+		('cli fast decode', ['-m', 'ggworkshop', 'decode', 'nes', 'SXIOPO', '-f', 'csv']),
+		('cli fast text', ['-m', 'ggworkshop', 'decode', 'nes', 'WALNUT', '-H'])
+	)
+
+	for name, argv in commands:
+		argv = [sys.executable] + argv
+		subprocess.run(argv, cwd = root, env = env, check = True, stdout = subprocess.DEVNULL)
+		times = []
+		for i in range(runs):
+			start = time.perf_counter()
+			subprocess.run(argv, cwd = root, env = env, check = True, stdout = subprocess.DEVNULL)
+			times.append(time.perf_counter() - start)
+		yield name, min(times) * 1000, 'ms'
+
+def memory(count):
+	# the whole batch path, streamed to /dev/null, so this should not grow with the number of codes
+	for kind in ('nes8', 'gb9'):
+		lines = codes(kind, count)
+		with open(os.devnull, 'w') as out:
+			tracemalloc.start()
+			batch.write_csv(batch.process(kind[:-1], lines), out)
+			peak = tracemalloc.get_traced_memory()[1]
+			tracemalloc.stop()
+		yield 'peak batch ' + kind, peak / 1024, 'KiB'
+
+def run(quick):
+	count = 20000 if quick else 200000
+	repeat = 3 if quick else 5
+	for results in (latency(repeat), throughput(count, repeat), cold_start(5 if quick else 20), memory(count * 5)):
+		for name, value, unit in results:
+			print('{0:<18} {1:14.2f} {2}'.format(name, value, unit))
+			yield name, value, unit
+
+def compare(results, baseline, threshold):
+	slower = []
+	print('\n{0:<18} {1:>14} {2:>14} {3:>8}'.format('', 'baseline', 'now', 'change'))
+	for name, value, unit in results:
+		if name not in baseline: continue
+		old = baseline[name]['value']
+		change = value / old - 1 if old else 0.0
+		worse = -change if unit in HIGHER else change
+		print('{0:<18} {1:14.2f} {2:14.2f} {3:+8.1%}{4}'.format(name, old, value, change, '  <- slower' if worse > threshold else ''))
+		if worse > threshold: slower.append(name)
+
+	return slower
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = 'Benchmarks the GGWorkshop codec.')
+	parser.add_argument('--quick', action = 'store_true', help = 'fewer codes and repeats')
+	parser.add_argument('--save', metavar = '<file>', help = 'save the results as JSON')
+	parser.add_argument('--compare', metavar = '<file>', help = 'compare against results saved with --save')
+	parser.add_argument('--threshold', type = float, default = 0.1, metavar = '<fraction>', help = 'how much worse a result can be before --compare fails (default 0.1)')
+	args = parser.parse_args()
+
+	results = list(run(args.quick))
+
+	if args.save:
+		with open(args.save, 'w') as f:
+			json.dump({name: {'value': value, 'unit': unit} for name, value, unit in results}, f, indent = '\t')
+			f.write('\n')
+
+	if args.compare:
+		with open(args.compare) as f:
+			slower = compare(results, json.load(f), args.threshold)
+		if slower: sys.exit('slower than the baseline: ' + ', '.join(slower))
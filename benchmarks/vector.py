@@ -0,0 +1,58 @@
+# per-code codec vs the NumPy batch codec
+# usage: python benchmarks/vector.py [codes]
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ggworkshop import codec
+
+try: import numpy as np
+except ImportError:
+	print('NumPy is not installed, nothing to compare against.')
+	sys.exit()
+
+from ggworkshop import vector
+
+def rate(name, count, func, *args):
+	start = time.perf_counter()
+	func(*args)
+	elapsed = time.perf_counter() - start
+	print('{0:<28} {1:10.0f} codes/s'.format(name, count / elapsed))
+	return elapsed
+
+def per_code(platform, codes):
+	for code in codes:
+		codec.decode(platform, code)
+
+def per_code_encode(platform, address, value, condition):
+	for i in range(len(address)):
+		codec.encode(platform, address[i], value[i], None if condition is None else condition[i])
+
+if __name__ == '__main__':
+	count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+	random.seed(0)
+
+	nes6 = [''.join(random.choice(codec.NES_ALPHABET) for i in range(6)) for j in range(count)]
+	nes8 = [''.join(random.choice(codec.NES_ALPHABET) for i in range(8)) for j in range(count)]
+	gb6 = ['{0:06X}'.format(random.getrandbits(24)) for j in range(count)]
+	gb9 = ['{0:09X}'.format(random.getrandbits(36)) for j in range(count)]
+	snes = ['{0:08X}'.format(random.getrandbits(32)) for j in range(count)]
+	mega = [''.join(random.choice(codec.MEGA_ALPHABET) for i in range(8)) for j in range(count)]
+	address = [random.randrange(0x8000, 0x10000) for j in range(count)]
+	value = [random.randrange(256) for j in range(count)]
+	condition = [random.randrange(256) for j in range(count)]
+
+	for name, platform, codes in (('NES 6 letters', 'nes', nes6), ('NES 8 letters', 'nes', nes8), ('GB 6 digits', 'gb', gb6), ('GB 9 digits', 'gb', gb9), ('SNES', 'snes', snes), ('Mega Drive', 'mega', mega)):
+		array = np.array(codes, 'S9')
+		slow = rate(name + ', per code', count, per_code, platform, codes)
+		fast = rate(name + ', vector', count, vector.decode, platform, array)
+		print('{0:<28} {1:10.1f}x\n'.format('speedup', slow / fast))
+
+	for name, platform, cond in (('NES encode 6', 'nes', None), ('NES encode 8', 'nes', condition), ('GB encode 6', 'gb', None), ('GB encode 9', 'gb', condition)):
+		slow = rate(name + ', per code', count, per_code_encode, platform, address, value, cond)
+		fast = rate(name + ', vector', count, vector.encode, platform, np.array(address), np.array(value), None if cond is None else np.array(cond))
+		print('{0:<28} {1:10.1f}x\n'.format('speedup', slow / fast))
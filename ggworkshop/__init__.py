@@ -0,0 +1,13 @@
+# GGWorkshop as a library - see README.md
+# importing this does no I/O, argument parsing or platform-specific imports
+
+import os
+
+version = '0.3.0'
+
+from .codec import decode, encode, detect, Platform, DecodeResult, EncodeResult, InvalidCode, NotHexCode, UnsupportedPlatform
+
+# GGWORKSHOP_STATS=1 turns on the timings and counters of ggworkshop.instrument
+if os.environ.get('GGWORKSHOP_STATS', '0') != '0':
+	from . import instrument
+	instrument.enable()
@@ -0,0 +1,98 @@
+# python -m ggworkshop: the same command line as main.py, with a fast path for scripts that run
+# GGWorkshop once per code; a single encode/decode with csv/json/bin output, or text output with
+# -H, is answered here, without argparse, the console stuff or main.py (which has to be compiled
+# on every run), everything else is handed to main.py as it is
+
+import os
+import sys
+
+from . import codec
+
+# flags that don't change csv/json/bin output, or text output with -H
+IGNORED = {'-n', '--nologo', '-a', '--autoexit', '-r', '--ramcode'}
+HEADLESS = {'-H', '--headless'}
+
+# the exit status, or None if main.py has to do it (including every error message)
+def fast(argv):
+	if os.environ.get('GGWORKSHOP_STATS', '0') != '0': return None
+
+	positional = []
+	options = {'-f': None, '-R': None}
+	names = {'--format': '-f', '--ram': '-R'}
+	headless = False
+	i = 0
+	while i < len(argv):
+		arg = argv[i]
+		if arg in IGNORED: pass
+		elif arg in HEADLESS: headless = True
+		elif names.get(arg, arg) in options and i + 1 < len(argv):
+			options[names.get(arg, arg)] = argv[i + 1]
+			i += 1
+		elif arg.startswith('-'): return None
+		else: positional.append(arg)
+		i += 1
+
+	output = options['-f']
+	ram = options['-R']
+	if output is None and positional[:1] in (['encode'], ['decode']): output = 'text'
+	# without -H, text output comes with the logo, prompts and Enter presses
+	if output == 'text' and not headless: return None
+	if output not in ('text', 'csv', 'json', 'bin') or ram not in (None, 'allow', 'flag', 'deny') or len(positional) < 3: return None
+	option, platform = positional[:2]
+	if platform not in codec.PLATFORMS and (platform != 'auto' or option != 'decode'): return None
+
+	from . import batch
+	if option == 'decode' and len(positional) == 3:
+		code = positional[2]
+		if platform == 'auto':
+			platform = codec.detect(code)
+			if platform is None: return None
+		row = batch.decode_row(platform, 1, code)
+	elif option == 'encode' and len(positional) in (4, 5):
+		# the same checks as main.py, which prints the error
+		fields = positional[2:]
+		try:
+			address = batch.parse_hex(fields[0], codec.ADDRESS_DIGITS[platform], 'address')
+			value = batch.parse_hex(fields[1], codec.VALUE_DIGITS[platform], 'value')
+			condition = batch.parse_hex(fields[2], 2, 'condition') if len(fields) == 3 else None
+			codec.get(platform).check(address, value, condition)
+		except ValueError: return None
+		row = batch.encode_row(platform, 1, fields)
+	else: return None
+
+	result = row[4]
+	if output == 'text':
+		# main.py prints why a code was rejected or denied
+		if result is None or ram == 'deny' and result.ram: return None
+		from . import text
+		try:
+			# RAM codes get a note unless they're allowed (-H means flag, not prompt)
+			print(text.decoded(result, result.ram and ram != 'allow') if option == 'decode' else text.encoded(result, result.ram and ram != 'allow'), flush = True)
+		except BrokenPipeError:
+			os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+		return 0
+
+	try:
+		if output in batch.BINARY:
+			batch.WRITERS[output]([row], sys.stdout.buffer)
+			sys.stdout.buffer.flush()
+		else:
+			batch.WRITERS[output]([row], sys.stdout)
+			sys.stdout.flush()
+	except BrokenPipeError:
+		os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+	return 1 if result is None or ram == 'deny' and result.ram else 0
+
+def main():
+	status = fast(sys.argv[1:])
+	if status is not None: sys.exit(status)
+
+	import runpy
+	path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'main.py')
+	if not os.path.exists(path): sys.exit('main.py not found next to the ggworkshop package')
+	sys.argv[0] = path
+	runpy.run_path(path, run_name = '__main__')
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,126 @@
+# audit of a code list: which codes a real Game Genie rejects or that do nothing, and which are
+# the same code written differently; one pass, memory grows with the number of distinct codes
+#
+# categories (a code can be in several):
+# rejected   not a code for the platform at all
+# invalid    invalid NES letters / failed GB 8th character check (a replacement code works)
+# ram        modifies RAM, which a real Game Genie can't do
+# useless    the condition is the same as the value, so the code does nothing
+# duplicate  does exactly what an earlier code does (e.g. the two NES codes encode() gives you)
+
+import collections
+
+from . import batch, codec
+
+CATEGORIES = ('rejected', 'invalid', 'ram', 'useless', 'duplicate')
+FIELDS = ('line', 'platform', 'input', 'code', 'address', 'value', 'condition', 'categories', 'duplicate_of', 'replacement', 'error')
+
+# line, platform, input, result (None if rejected), categories, duplicate_of (line), error
+Row = collections.namedtuple('Row', 'line platform input result categories duplicate_of error')
+
+class Audit(object):
+	def __init__(self, platform = 'auto', cache = None):
+		if platform != 'auto': codec.get(platform)
+		self.platform = platform
+		self.cache = cache
+		self.codes = 0
+		self.ok = 0 # codes in no category
+		self.counts = dict.fromkeys(CATEGORIES, 0)
+		self.platforms = collections.Counter()
+		self.first = {} # (platform, address, value, condition) -> first line with it
+
+	@property
+	def distinct(self):
+		return len(self.first)
+
+	def check(self, number, code):
+		self.codes += 1
+		platform = self.platform
+		if platform == 'auto':
+			platform = codec.detect(code)
+			if platform is None: return self._rejected(number, None, code, 'not a Game Genie code for any platform')
+
+		try: result = (codec if self.cache is None else self.cache).decode(platform, code)
+		except ValueError as e: return self._rejected(number, platform, code, e)
+
+		categories = []
+		if result.invalid: categories.append('invalid')
+		if result.ram: categories.append('ram')
+		if result.condition is not None and result.condition == result.value: categories.append('useless')
+
+		key = (platform, result.address, result.value, result.condition)
+		duplicate_of = self.first.setdefault(key, number)
+		if duplicate_of == number: duplicate_of = None
+		else: categories.append('duplicate')
+
+		self.platforms[platform] += 1
+		for category in categories:
+			self.counts[category] += 1
+		if not categories: self.ok += 1
+
+		return Row(number, platform, code, result, tuple(categories), duplicate_of, None)
+
+	def _rejected(self, number, platform, code, error):
+		self.counts['rejected'] += 1
+		return Row(number, platform, code, None, ('rejected',), None, str(error))
+
+	# one Row per code, the first field of every non-empty line is the code
+	def run(self, lines, start = 1):
+		for number, line in enumerate(lines, start):
+			fields = line.replace(',', ' ').split()
+			if fields: yield self.check(number, fields[0])
+
+	def summary(self):
+		return {'codes': self.codes, 'distinct': self.distinct, 'ok': self.ok, 'categories': dict(self.counts), 'platforms': dict(self.platforms)}
+
+# the FIELDS of a row
+def expand(row):
+	result = row.result
+	if result is None: return (row.line, row.platform, row.input, None, None, None, None, ' '.join(row.categories), None, None, row.error)
+	return (row.line, row.platform, row.input, result.code) + result.hex() + (' '.join(row.categories), row.duplicate_of, result.replacement, None)
+
+def write_csv(rows, out):
+	batch.write_fields_csv(FIELDS, expand, rows, out)
+
+def write_json(rows, out):
+	batch.write_fields_json(FIELDS, expand, rows, out)
+
+# bin records are batch.RECORD with the categories as flags, the same bits batch uses where there
+# is one (so an audit file loads like a batch file) plus these two; duplicate_of isn't in them
+USELESS = 16
+DUPLICATE = 32
+FLAGS = {'rejected': batch.ERROR, 'invalid': codec.INVALID, 'ram': codec.RAM, 'useless': USELESS, 'duplicate': DUPLICATE}
+
+def write_bin(rows, out):
+	batch.write_records(((row.line, row.platform, row.result, sum(FLAGS[category] for category in row.categories)) for row in rows), out)
+
+def _describe(row):
+	text = 'line {0}: {1}'.format(row.line, row.input)
+	if row.error: return text + ' (' + row.error + ')'
+	if row.duplicate_of is not None: text += ' (same as line {0})'.format(row.duplicate_of)
+	if row.result.invalid: text += ' (use ' + row.result.replacement + ')'
+	return text
+
+# a readable report: the counts, then up to listed codes of each category
+def write_text(audit, rows, out, listed = 100):
+	listings = {category: [] for category in CATEGORIES}
+	more = dict.fromkeys(CATEGORIES, 0)
+	for row in rows:
+		for category in row.categories:
+			if len(listings[category]) < listed: listings[category].append(_describe(row))
+			else: more[category] += 1
+
+	out.write('Audited {0} codes, {1} distinct.\n\n'.format(audit.codes, audit.distinct))
+	out.write('{0:<10} {1:>10}\n'.format('ok', audit.ok))
+	for category in CATEGORIES:
+		out.write('{0:<10} {1:>10}\n'.format(category, audit.counts[category]))
+	if audit.platforms:
+		out.write('\nBy platform: ' + ', '.join('{0} {1}'.format(codec.NAMES[platform], count) for platform, count in audit.platforms.most_common()) + '\n')
+
+	for category in CATEGORIES:
+		if not listings[category]: continue
+		out.write('\n{0} ({1}):\n'.format(category, audit.counts[category]))
+		out.write(''.join('  ' + line + '\n' for line in listings[category]))
+		if more[category]: out.write('  ... and {0} more\n'.format(more[category]))
+
+WRITERS = {'csv': write_csv, 'json': write_json, 'bin': write_bin}
@@ -0,0 +1,130 @@
+# batch mode: one code (decode) or "address value [condition]" row (encode) per line
+# everything is a generator, so memory use doesn't grow with the input
+# with platform 'auto' every code is decoded for the platform it looks like (see codec.detect())
+# the row functions take an optional cache.Cache, which has the same decode()/encode() as codec
+
+import io
+import struct
+import itertools
+
+from . import codec
+
+FIELDS = ('line', 'mode', 'platform', 'input', 'code', 'alt_code', 'address', 'value', 'condition', 'invalid', 'replacement', 'ram', 'error')
+
+def parse_hex(text, digits, name):
+	if len(text) != digits:
+		raise ValueError('hex {0} must be {1} digits: {2}'.format(name, digits, text))
+	try: return int(text, 16)
+	except ValueError: raise ValueError('invalid hex {0}: {1}'.format(name, text))
+
+# a row is (line, mode, platform, input, result, error), result being the DecodeResult/EncodeResult
+# (None if the line was rejected, error says why); the writers turn it into FIELDS or a RECORD
+
+def _error(number, mode, platform, text, error):
+	return (number, mode, platform, text, None, str(error))
+
+def decoded_row(number, text, result):
+	return (number, 'decode', result.platform, text, result, None)
+
+def encoded_row(number, text, result):
+	return (number, 'encode', result.platform, text, result, None)
+
+# the FIELDS of a row
+def expand(row):
+	number, mode, platform, text, result, error = row
+	if result is None: return (number, mode, platform, text, None, None, None, None, None, None, None, None, error)
+
+	if mode == 'decode': return (number, mode, platform, text, result.code, None) + result.hex() + (result.invalid, result.replacement, result.ram, None)
+	codes = result.codes
+	return (number, mode, platform, text, codes[0], codes[1] if len(codes) > 1 else None) + result.hex() + (False, None, result.ram, None)
+
+def decode_row(platform, number, code, cache = None):
+	if platform == 'auto':
+		platform = codec.detect(code)
+		if platform is None: return _error(number, 'decode', None, code, 'not a Game Genie code for any platform')
+
+	try: result = (codec if cache is None else cache).decode(platform, code)
+	except ValueError as e: return _error(number, 'decode', platform, code, e)
+
+	return decoded_row(number, code, result)
+
+def encode_row(platform, number, fields, cache = None):
+	text = ' '.join(fields)
+	if platform == 'auto': return _error(number, 'encode', None, text, 'the platform has to be given to encode codes')
+
+	try:
+		if len(fields) > 3: raise ValueError('too many fields')
+		address = parse_hex(fields[0], codec.ADDRESS_DIGITS[platform], 'address')
+		value = parse_hex(fields[1], codec.VALUE_DIGITS[platform], 'value')
+		condition = parse_hex(fields[2], 2, 'condition') if len(fields) == 3 else None
+		result = (codec if cache is None else cache).encode(platform, address, value, condition)
+	except ValueError as e: return _error(number, 'encode', platform, text, e)
+
+	return encoded_row(number, text, result)
+
+def process(platform, lines, start = 1, cache = None):
+	for number, line in enumerate(lines, start):
+		fields = line.replace(',', ' ').split()
+		if not fields: continue
+
+		if len(fields) == 1: yield decode_row(platform, number, fields[0], cache)
+		else: yield encode_row(platform, number, fields, cache)
+
+# the writers format a chunk of rows at a time and hand it to out in one write()
+def _chunks(rows, size = 1024):
+	rows = iter(rows)
+	while True:
+		chunk = list(itertools.islice(rows, size))
+		if not chunk: return
+		yield chunk
+
+# csv and json are imported by the writers that need them, they pull in re, which is most of
+# the startup time of python -m ggworkshop
+# these two take the header and the function that turns a row into its fields, so other kinds
+# of rows (audit.py's) are written the same way
+def write_fields_csv(fields, expand, rows, out):
+	import csv
+	out.write(','.join(fields) + '\n')
+	buffer = io.StringIO()
+	writer = csv.writer(buffer, lineterminator = '\n')
+	for chunk in _chunks(rows):
+		writer.writerows(map(expand, chunk))
+		out.write(buffer.getvalue())
+		buffer.seek(0)
+		buffer.truncate()
+
+def write_fields_json(fields, expand, rows, out):
+	import json
+	# JSON Lines, one object per input line
+	for chunk in _chunks(rows):
+		out.write(''.join(json.dumps(dict(zip(fields, expand(row)))) + '\n' for row in chunk))
+
+def write_csv(rows, out):
+	write_fields_csv(FIELDS, expand, rows, out)
+
+def write_json(rows, out):
+	write_fields_json(FIELDS, expand, rows, out)
+
+# fixed-size little-endian records for the bin format, no header, so a whole file loads with
+# np.fromfile(path, np.dtype(batch.RECORD_DTYPE)); n is the code as an int (see codec.py),
+# platform the index in codec.PLATFORMS (255 if not known), condition -1 if there is none
+RECORD = struct.Struct('<QIIHhBBBx')
+RECORD_DTYPE = [('n', '<u8'), ('line', '<u4'), ('address', '<u4'), ('value', '<u2'), ('condition', '<i2'), ('platform', 'u1'), ('length', 'u1'), ('flags', 'u1'), ('pad', 'u1')]
+
+# record flags, on top of codec.INVALID and codec.RAM
+ENCODED = 4
+ERROR = 8 # the line was rejected, everything but line, platform and flags is 0
+
+# (line, platform, result, flags) of each row, result None for a rejected line; the result's own
+# flags are added, so other kinds of rows (audit.py's) are written the same way
+def write_records(records, out):
+	ids = {name: i for i, name in enumerate(codec.PLATFORMS)}
+	pack = RECORD.pack
+	for chunk in _chunks(records):
+		out.write(b''.join(pack(0, number, 0, 0, 0, ids.get(platform, 255), 0, flags) if result is None else pack(result.n, number, result.address, result.value, -1 if result.condition is None else result.condition, ids[platform], result.length, flags | result.flags) for number, platform, result, flags in chunk))
+
+def write_bin(rows, out):
+	write_records(((number, platform, result, (ENCODED if mode == 'encode' else 0) | (ERROR if result is None else 0)) for number, mode, platform, text, result, error in rows), out)
+
+WRITERS = {'csv': write_csv, 'json': write_json, 'bin': write_bin}
+BINARY = {'bin'} # formats written to a binary stream
@@ -0,0 +1,80 @@
+# a bounded LRU cache in front of codec.decode()/encode(), for traffic where the same few codes
+# come up again and again; safe to share between threads
+# the counters (stats()) are there to size it from real traffic
+# results are immutable, so sharing them between callers is fine
+
+import threading
+import collections
+
+from . import codec
+
+class Cache(object):
+	def __init__(self, size = 65536):
+		if size < 1:
+			raise ValueError('the cache must hold at least 1 result')
+		self.size = size
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+		self._items = collections.OrderedDict()
+		self._lock = threading.Lock()
+
+	def _get(self, key):
+		with self._lock:
+			result = self._items.get(key)
+			if result is None:
+				self.misses += 1
+			else:
+				self._items.move_to_end(key)
+				self.hits += 1
+
+		return result
+
+	def _put(self, key, result):
+		with self._lock:
+			self._items[key] = result
+			self._items.move_to_end(key)
+			while len(self._items) > self.size:
+				self._items.popitem(last = False)
+				self.evictions += 1
+
+	# invalid codes raise every time, only results are kept
+	def decode(self, platform, code):
+		key = (platform, codec.get(platform).normalize(code))
+		result = self._get(key)
+		if result is None:
+			result = codec.decode(platform, code)
+			self._put(key, result)
+
+		return result
+
+	def encode(self, platform, address, value, condition = None):
+		key = (platform, address, value, condition)
+		result = self._get(key)
+		if result is None:
+			result = codec.encode(platform, address, value, condition)
+			self._put(key, result)
+
+		return result
+
+	def resize(self, size):
+		if size < 1:
+			raise ValueError('the cache must hold at least 1 result')
+		with self._lock:
+			self.size = size
+			while len(self._items) > size:
+				self._items.popitem(last = False)
+				self.evictions += 1
+
+	def clear(self):
+		with self._lock:
+			self._items.clear()
+			self.hits = self.misses = self.evictions = 0
+
+	def stats(self):
+		with self._lock:
+			lookups = self.hits + self.misses
+			return {'size': self.size, 'entries': len(self._items), 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'hit_rate': self.hits / lookups if lookups else 0.0}
+
+	def __len__(self):
+		return len(self._items)
@@ -0,0 +1,669 @@
+# the Game Genie codec, no printing, prompting or argument parsing in here
+# a code is kept as one int with a nibble per letter/digit, first one in the highest nibble
+
+import collections
+
+class InvalidCode(ValueError):
+	pass
+
+class NotHexCode(InvalidCode):
+	pass
+
+class UnsupportedPlatform(ValueError):
+	pass
+
+
+# name -> Platform, see register() at the bottom
+PLATFORMS = {}
+
+# the same things by platform name, filled in by register()
+NAMES = {}
+SHORT_NAMES = {}
+LENGTHS = {} # code lengths without dashes, short (no condition) first
+ADDRESS_DIGITS = {}
+VALUE_DIGITS = {}
+
+# platforms tried by detect(), in their detect_order
+DETECT = []
+
+# precomputed lookup tables (see tables.py), None means everything is computed
+backend = None
+
+
+# NES
+
+NES_ALPHABET = 'APZLGITYEOXUKSVN'
+NES_INVALID = 0x10 # not a Game Genie letter, decodes like an A
+NES_BAD = 0x20 # digit or whitespace, the whole code is invalid
+
+def _nes_nibble(char):
+	if char in NES_ALPHABET: return NES_ALPHABET.index(char)
+	if char in NES_ALPHABET.lower(): return NES_ALPHABET.lower().index(char)
+	if char.isspace() or char.isnumeric(): return NES_BAD
+	return NES_INVALID
+
+# stand-in byte for characters outside latin-1
+def _nes_byte(char):
+	if ord(char) < 256: return ord(char)
+	return ord('0') if _nes_nibble(char) == NES_BAD else ord('?')
+
+# byte -> nibble (plus flags) and byte -> two letters
+NES_NIBBLES = tuple(_nes_nibble(chr(i)) for i in range(256))
+NES_PAIRS = tuple(NES_ALPHABET[i >> 4] + NES_ALPHABET[i & 15] for i in range(256))
+
+def nes_code_to_int(code):
+	try: raw = code.encode('latin-1')
+	except UnicodeEncodeError: raw = bytes(_nes_byte(char) for char in code)
+
+	n = 0
+	flags = 0
+	for byte in raw:
+		nibble = NES_NIBBLES[byte]
+		flags |= nibble
+		n = n << 4 | nibble & 15
+
+	return n, flags & (NES_INVALID | NES_BAD)
+
+def nes_int_to_code(n, length):
+	code = ''
+	for shift in range((length - 2) * 4, -1, -8):
+		code += NES_PAIRS[n >> shift & 255]
+
+	return code
+
+# returns address << 8 | value
+def nes_decode6(n):
+	n0 = n >> 20 & 15; n1 = n >> 16 & 15; n2 = n >> 12 & 15
+	n3 = n >> 8 & 15; n4 = n >> 4 & 15; n5 = n & 15
+
+	address = 0x8000 | (n3 & 7) << 12 | (n4 & 8 | n5 & 7) << 8 | (n1 & 8 | n2 & 7) << 4 | n3 & 8 | n4 & 7
+	value = (n0 & 8 | n1 & 7) << 4 | n5 & 8 | n0 & 7
+
+	return address << 8 | value
+
+# returns address << 16 | condition << 8 | value
+def nes_decode8(n):
+	n0 = n >> 28 & 15; n1 = n >> 24 & 15; n2 = n >> 20 & 15; n3 = n >> 16 & 15
+	n4 = n >> 12 & 15; n5 = n >> 8 & 15; n6 = n >> 4 & 15; n7 = n & 15
+
+	address = 0x8000 | (n3 & 7) << 12 | (n4 & 8 | n5 & 7) << 8 | (n1 & 8 | n2 & 7) << 4 | n3 & 8 | n4 & 7
+	condition = (n6 & 8 | n7 & 7) << 4 | n5 & 8 | n6 & 7
+	value = (n0 & 8 | n1 & 7) << 4 | n7 & 8 | n0 & 7
+
+	return address << 16 | condition << 8 | value
+
+# the third letter's high bit is left clear, nes_variant() gives the other code
+def nes_encode6(address, value):
+	a0 = address >> 12 & 15; a1 = address >> 8 & 15; a2 = address >> 4 & 15; a3 = address & 15
+	v0 = value >> 4 & 15; v1 = value & 15
+
+	return (v0 & 8 | v1 & 7) << 20 | (a2 & 8 | v0 & 7) << 16 | (a2 & 7) << 12 | (a3 & 8 | a0 & 7) << 8 | (a1 & 8 | a3 & 7) << 4 | v1 & 8 | a1 & 7
+
+def nes_encode8(address, value, condition):
+	a0 = address >> 12 & 15; a1 = address >> 8 & 15; a2 = address >> 4 & 15; a3 = address & 15
+	v0 = value >> 4 & 15; v1 = value & 15
+	c0 = condition >> 4 & 15; c1 = condition & 15
+
+	return (v0 & 8 | v1 & 7) << 28 | (a2 & 8 | v0 & 7) << 24 | (a2 & 7) << 20 | (a3 & 8 | a0 & 7) << 16 | (a1 & 8 | a3 & 7) << 12 | (c1 & 8 | a1 & 7) << 8 | (c0 & 8 | c1 & 7) << 4 | v1 & 8 | c0 & 7
+
+def nes_variant(n, length):
+	return n | 8 << (length - 3) * 4
+
+
+# Game Boy / Game Gear
+
+GB_DIGITS = '0123456789ABCDEF'
+GB_NOT_HEX = 0x10
+GB_BAD = 0x20 # whitespace
+
+# lowest sixth digit that still points into ROM
+GB_ROM_DIGIT = {'gb': 8, 'gear': 4}
+
+def _gb_nibble(char):
+	if char in GB_DIGITS: return GB_DIGITS.index(char)
+	if char in GB_DIGITS.lower(): return GB_DIGITS.lower().index(char)
+	if char.isspace(): return GB_BAD
+	return GB_NOT_HEX
+
+GB_NIBBLES = tuple(_gb_nibble(chr(i)) for i in range(256))
+
+def gb_code_to_int(code):
+	try: raw = code.encode('latin-1')
+	except UnicodeEncodeError: raw = bytes(ord(char) if ord(char) < 256 else ord(' ' if char.isspace() else '?') for char in code)
+
+	n = 0
+	flags = 0
+	for byte in raw:
+		nibble = GB_NIBBLES[byte]
+		flags |= nibble
+		n = n << 4 | nibble & 15
+
+	return n, flags & (GB_NOT_HEX | GB_BAD)
+
+# returns address << 8 | value
+def gb_decode6(n):
+	return ((n & 15) ^ 15) << 20 | (n >> 4 & 0xFFF) << 8 | n >> 16 & 255
+
+# returns address << 16 | condition << 8 | value
+def gb_decode9(n):
+	check = n >> 8 & 15 | (n & 15) << 4
+	condition = (check << 2 | check >> 6) & 255 ^ 0xBA
+
+	return ((n >> 12 & 15) ^ 15) << 28 | (n >> 16 & 0xFFF) << 16 | condition << 8 | n >> 28 & 255
+
+# the same code with an 8th digit that passes the check
+def gb_fix9(n):
+	return n & ~0xF0 | ((n >> 8 & 15) ^ 8) << 4
+
+def gb_encode6(address, value):
+	return value << 16 | (address & 0xFFF) << 4 | (address >> 12 ^ 15)
+
+# the 8th digit is always made to pass the check
+def gb_encode9(address, value, condition):
+	check = condition ^ 0xBA
+	check = (check >> 2 | check << 6) & 255
+
+	return gb_encode6(address, value) << 12 | (check & 15) << 8 | (check & 15 ^ 8) << 4 | check >> 4
+
+def gb_ram(platform, n, length):
+	return (n >> (length - 6) * 4 & 15) < GB_ROM_DIGIT[platform]
+
+def gb_dashes(code):
+	if len(code) == 9: return code[:3] + '-' + code[3:6] + '-' + code[6:]
+	return code[:3] + '-' + code[3:]
+
+
+# bit shuffling done with one lookup table per input byte
+# layouts are written MSB first, one letter per bit, like in the usual Game Genie docs
+
+def _bit_tables(source, target):
+	tables = []
+	for byte in range((len(source) + 7) // 8):
+		# what each bit of this byte turns into, then every byte value from those
+		bits = []
+		for bit in range(8):
+			position = len(source) - 1 - (byte * 8 + bit)
+			bits.append(1 << len(target) - 1 - target.index(source[position]) if position >= 0 else 0)
+
+		table = [0] * 256
+		for i in range(1, 256):
+			table[i] = table[i & i - 1] | bits[(i & -i).bit_length() - 1]
+		tables.append(tuple(table))
+
+	return tuple(tables)
+
+# a platform's lookup tables, built the first time one of them is used, so a program that only
+# handles NES codes doesn't spend its startup on the SNES/Mega Drive ones
+class _Tables(object):
+	def __init__(self, build):
+		self._build = build
+
+	def __getattr__(self, name):
+		if name.startswith('_'): raise AttributeError(name)
+		self.__dict__.update(self._build())
+		return self.__dict__[name]
+
+
+# Super Nintendo
+
+SNES_DIGITS = 'DF4709156BC8A23E' # the Game Genie digit for 0-F
+SNES_NOT_HEX = 0x10
+SNES_BAD = 0x20 # whitespace
+
+# value (VVVVVVVV) and address bits as they are in a code, and decoded (address << 8 | value)
+SNES_CODE = 'VWXYZ012ijklqrstopabcduvwxefghmn'
+SNES_DECODED = 'abcdefghijklmnopqrstuvwxVWXYZ012'
+
+def _snes_nibble(char):
+	if char in SNES_DIGITS: return SNES_DIGITS.index(char)
+	if char in SNES_DIGITS.lower(): return SNES_DIGITS.lower().index(char)
+	if char.isspace(): return SNES_BAD
+	return SNES_NOT_HEX
+
+_snes = _Tables(lambda: {
+	'NIBBLES': tuple(_snes_nibble(chr(i)) for i in range(256)),
+	'PAIRS': tuple(SNES_DIGITS[i >> 4] + SNES_DIGITS[i & 15] for i in range(256)),
+	'DECODE': _bit_tables(SNES_CODE, SNES_DECODED),
+	'ENCODE': _bit_tables(SNES_DECODED, SNES_CODE)
+})
+
+def snes_code_to_int(code):
+	nibbles = _snes.NIBBLES
+	n = 0
+	flags = 0
+	for byte in code.encode('latin-1', 'replace'):
+		nibble = nibbles[byte]
+		flags |= nibble
+		n = n << 4 | nibble & 15
+
+	return n, flags & (SNES_NOT_HEX | SNES_BAD)
+
+def snes_int_to_code(n):
+	pairs = _snes.PAIRS
+	return pairs[n >> 24] + pairs[n >> 16 & 255] + '-' + pairs[n >> 8 & 255] + pairs[n & 255]
+
+# returns address << 8 | value
+def snes_decode(n):
+	t0, t1, t2, t3 = _snes.DECODE
+	return t0[n & 255] | t1[n >> 8 & 255] | t2[n >> 16 & 255] | t3[n >> 24]
+
+def snes_encode(address, value):
+	t0, t1, t2, t3 = _snes.ENCODE
+	return t0[value] | t1[address & 255] | t2[address >> 8 & 255] | t3[address >> 16]
+
+
+# Mega Drive / Genesis
+
+MEGA_ALPHABET = 'ABCDEFGHJKLMNPRSTVWXYZ0123456789' # 5 bits per character
+MEGA_INVALID = 0x20
+
+# address (A-X) and value (a-p) bits as they are in a code, and decoded (address << 16 | value)
+MEGA_CODE = 'ijklmnopIJKLMNOPABCDEFGHdefghabcQRSTUVWX'
+MEGA_DECODED = 'ABCDEFGHIJKLMNOPQRSTUVWXabcdefghijklmnop'
+
+def _mega_bits(char):
+	if char in MEGA_ALPHABET: return MEGA_ALPHABET.index(char)
+	if char in MEGA_ALPHABET.lower(): return MEGA_ALPHABET.lower().index(char)
+	return MEGA_INVALID
+
+_mega = _Tables(lambda: {
+	'CHARS': tuple(_mega_bits(chr(i)) for i in range(256)),
+	'PAIRS': tuple(MEGA_ALPHABET[i >> 5] + MEGA_ALPHABET[i & 31] for i in range(1024)),
+	'DECODE': _bit_tables(MEGA_CODE, MEGA_DECODED),
+	'ENCODE': _bit_tables(MEGA_DECODED, MEGA_CODE)
+})
+
+def mega_code_to_int(code):
+	chars = _mega.CHARS
+	n = 0
+	flags = 0
+	for byte in code.encode('latin-1', 'replace'):
+		bits = chars[byte]
+		flags |= bits
+		n = n << 5 | bits & 31
+
+	return n, flags & MEGA_INVALID
+
+def mega_int_to_code(n):
+	pairs = _mega.PAIRS
+	return pairs[n >> 30] + pairs[n >> 20 & 1023] + '-' + pairs[n >> 10 & 1023] + pairs[n & 1023]
+
+# returns address << 16 | value
+def mega_decode(n):
+	t0, t1, t2, t3, t4 = _mega.DECODE
+	return t0[n & 255] | t1[n >> 8 & 255] | t2[n >> 16 & 255] | t3[n >> 24 & 255] | t4[n >> 32]
+
+def mega_encode(address, value):
+	t0, t1, t2, t3, t4 = _mega.ENCODE
+	return t0[value & 255] | t1[value >> 8] | t2[address & 255] | t3[address >> 8 & 255] | t4[address >> 16]
+
+
+# results are immutable tuples of ints and flags (plus the platform name, which is shared), the
+# strings (code, replacement, hex address/value) are only made when they are asked for
+
+INVALID = 1 # invalid NES letters / failed GB 8th character check
+RAM = 2 # GB/Game Gear RAM, Mega Drive addresses above the cartridge ROM
+
+class _Result(object):
+	__slots__ = ()
+
+	@property
+	def ram(self):
+		return bool(self.flags & RAM)
+
+	# address, value and condition as hex strings
+	def hex(self):
+		platform = PLATFORMS[self.platform]
+		return ('{0:0{1}X}'.format(self.address, platform.address_digits), '{0:0{1}X}'.format(self.value, platform.value_digits), None if self.condition is None else '{0:02X}'.format(self.condition))
+
+# n is the code as an int, length its number of letters/digits; typed is the code as it was given,
+# only kept when it can't be made from n again (NES codes with invalid letters)
+class DecodeResult(_Result, collections.namedtuple('DecodeResult', 'platform n length address value condition flags typed')):
+	__slots__ = ()
+
+	@property
+	def code(self):
+		if self.typed is not None: return self.typed
+		return PLATFORMS[self.platform].format(self.n, self.length)
+
+	@property
+	def invalid(self):
+		return bool(self.flags & INVALID)
+
+	# the code that works on real hardware, for invalid ones
+	@property
+	def replacement(self):
+		if not self.flags & INVALID: return None
+		platform = PLATFORMS[self.platform]
+		return platform.format(platform.fix(self.n, self.length), self.length)
+
+	def __repr__(self):
+		return 'DecodeResult({0!r}, {1!r}, address = {2:#06x}, value = {3:#04x}, condition = {4})'.format(self.platform, self.code, self.address, self.value, self.condition if self.condition is None else '{0:#04x}'.format(self.condition))
+
+class EncodeResult(_Result, collections.namedtuple('EncodeResult', 'platform n length address value condition flags')):
+	__slots__ = ()
+
+	@property
+	def code(self):
+		return PLATFORMS[self.platform].format(self.n, self.length)
+
+	# every code that does this, the main one first (NES codes come in pairs)
+	@property
+	def codes(self):
+		platform = PLATFORMS[self.platform]
+		return tuple(platform.format(n, self.length) for n in platform.variants(self.n, self.length))
+
+	def __repr__(self):
+		return 'EncodeResult({0!r}, {1!r})'.format(self.platform, self.codes)
+
+
+# a platform's codec: what its codes look like and how to turn them into addresses and values
+# adding a platform is a subclass with these attributes filled in plus a register() call
+class Platform(object):
+	name = None
+	title = None # for messages
+	short_title = None
+	lengths = () # without dashes, short (no condition) first
+	group = 0 # characters between dashes, 0 if codes have none
+	address_digits = 4
+	value_digits = 2
+	first_address = 0
+	last_address = 0xFFFF
+	detect_order = None # where detect() tries it, lowest first; None if it's never guessed
+	family = None # platforms whose codes are made the same way share one, it picks the NumPy codec and main.py's interface
+
+	# a code in this platform's exact format, without the dashes; None if it isn't one
+	# used for guessing the platform, so it's stricter than decode()
+	def match(self, code):
+		code = code.upper()
+		if self.group and '-' in code:
+			groups = code.split('-')
+			if any(len(group) != self.group for group in groups[:-1]) or not 0 < len(groups[-1]) <= self.group: return None
+			code = ''.join(groups)
+		if len(code) not in self.lengths: return None
+		n, flags = self.code_to_int(code)
+		if flags: return None
+		return code
+
+	# the code as decode() sees it, so equal codes compare equal (e.g. as cache keys)
+	def normalize(self, code):
+		code = code.upper()
+		return code.replace('-', '') if self.group else code
+
+	# the code for n, with dashes
+	def format(self, n, length):
+		raise UnsupportedPlatform('decoding ' + self.title + ' Game Genie codes is not supported')
+
+	# the same code made valid, see DecodeResult.replacement
+	def fix(self, n, length):
+		return n
+
+	# n and the other codes that do the same thing
+	def variants(self, n, length):
+		return (n,)
+
+	def check(self, address, value, condition):
+		if not self.first_address <= address <= self.last_address:
+			raise ValueError('address must be between ${0:0{2}X} and ${1:0{2}X}'.format(self.first_address, self.last_address, self.address_digits))
+		if len(self.lengths) == 1:
+			if not 0 <= value < 1 << self.value_digits * 4:
+				raise ValueError('value must be between #$00 and #$' + 'FF' * (self.value_digits // 2))
+			if condition is not None:
+				raise ValueError(self.title + ' Game Genie codes cannot have a condition')
+		elif not 0 <= value <= 255 or condition is not None and not 0 <= condition <= 255:
+			raise ValueError('value and condition must be between #$00 and #$FF')
+
+	# just the address, None if the code is invalid
+	def address_of(self, code):
+		try: return self.decode(code).address
+		except InvalidCode: return None
+
+	def code_to_int(self, code):
+		raise UnsupportedPlatform('decoding ' + self.title + ' Game Genie codes is not supported')
+
+	def decode(self, code):
+		raise UnsupportedPlatform('decoding ' + self.title + ' Game Genie codes is not supported')
+
+	def encode(self, address, value, condition = None):
+		raise UnsupportedPlatform('encoding ' + self.title + ' Game Genie codes is not supported')
+
+	def __repr__(self):
+		return '<{0} Game Genie>'.format(self.title)
+
+class NESPlatform(Platform):
+	name = 'nes'
+	title = 'NES'
+	short_title = 'NES'
+	lengths = (6, 8)
+	detect_order = 0
+	family = 'nes'
+	first_address = 0x8000
+
+	def code_to_int(self, code):
+		return nes_code_to_int(code)
+
+	def format(self, n, length):
+		return nes_int_to_code(n, length)
+
+	def variants(self, n, length):
+		return (n, nes_variant(n, length))
+
+	def decode(self, code):
+		code = self.normalize(code)
+		if len(code) != 6 and len(code) != 8:
+			raise InvalidCode('NES Game Genie codes are 6 or 8 letters long')
+		n, flags = nes_code_to_int(code)
+		if flags & NES_BAD:
+			raise InvalidCode('NES Game Genie codes cannot contain digits or spaces')
+
+		# invalid letters decode like an A, so the code can't be made from n again
+		typed = code if flags & NES_INVALID else None
+		flags = INVALID if flags & NES_INVALID else 0
+		if len(code) == 8:
+			decoded = nes_decode8(n)
+			return DecodeResult(self.name, n, 8, decoded >> 16, decoded & 255, decoded >> 8 & 255, flags, typed)
+		decoded = backend.nes6[n] if backend else nes_decode6(n)
+		return DecodeResult(self.name, n, 6, decoded >> 8, decoded & 255, None, flags, typed)
+
+	def encode(self, address, value, condition = None):
+		self.check(address, value, condition)
+
+		if condition is None:
+			n = backend.nes6enc[(address - 0x8000) << 8 | value] if backend else nes_encode6(address, value)
+			length = 6
+		else:
+			n = nes_encode8(address, value, condition)
+			length = 8
+		return EncodeResult(self.name, n, length, address, value, condition, 0)
+
+	# the same letters hold the address in 6 and 8-letter codes
+	def address_of(self, code):
+		code = code.upper()
+		if len(code) != 6 and len(code) != 8: return None
+		n, flags = nes_code_to_int(code)
+		if flags & NES_BAD: return None
+		return nes_decode6(n >> (len(code) - 6) * 4) >> 8
+
+class GBPlatform(Platform):
+	name = 'gb'
+	title = 'Nintendo Game Boy'
+	short_title = 'GB'
+	lengths = (6, 9)
+	group = 3
+	detect_order = 1
+	family = 'gb'
+
+	def code_to_int(self, code):
+		return gb_code_to_int(code)
+
+	def format(self, n, length):
+		return gb_dashes('{0:0{1}X}'.format(n, length))
+
+	def fix(self, n, length):
+		return gb_fix9(n) if length == 9 else n
+
+	def decode(self, code):
+		code = self.normalize(code)
+		if len(code) != 6 and len(code) != 9:
+			raise InvalidCode(self.title + ' Game Genie codes are 6 or 9 digits long')
+		n, flags = gb_code_to_int(code)
+		if flags & GB_BAD:
+			raise InvalidCode(self.title + ' Game Genie codes cannot contain spaces')
+		if flags & GB_NOT_HEX:
+			raise NotHexCode(self.title + ' Game Genie codes are hexadecimal')
+
+		flags = RAM if gb_ram(self.name, n, len(code)) else 0
+		if len(code) == 9:
+			if gb_fix9(n) != n: flags |= INVALID
+			decoded = gb_decode9(n)
+			return DecodeResult(self.name, n, 9, decoded >> 16, decoded & 255, decoded >> 8 & 255, flags, None)
+		decoded = backend.gb6[n] if backend else gb_decode6(n)
+		return DecodeResult(self.name, n, 6, decoded >> 8, decoded & 255, None, flags, None)
+
+	def encode(self, address, value, condition = None):
+		self.check(address, value, condition)
+
+		if condition is None:
+			n = backend.gb6enc[address << 8 | value] if backend else gb_encode6(address, value)
+			length = 6
+		else:
+			n = gb_encode9(address, value, condition)
+			length = 9
+		return EncodeResult(self.name, n, length, address, value, condition, RAM if gb_ram(self.name, n, length) else 0)
+
+	# the same digits hold the address in 6 and 9-digit codes
+	def address_of(self, code):
+		code = code.upper().replace('-', '')
+		if len(code) != 6 and len(code) != 9: return None
+		n, flags = gb_code_to_int(code)
+		if flags: return None
+		return gb_decode6(n >> (len(code) - 6) * 4) >> 8
+
+# Game Gear codes look exactly like GB codes, only RAM starts lower (see GB_ROM_DIGIT)
+class GearPlatform(GBPlatform):
+	name = 'gear'
+	title = 'Sega Game Gear'
+	short_title = 'Game Gear'
+	detect_order = None # its codes can't be told apart from GB codes
+
+class SNESPlatform(Platform):
+	name = 'snes'
+	title = 'Super Nintendo'
+	short_title = 'SNES'
+	lengths = (8,)
+	group = 4
+	address_digits = 6
+	last_address = 0xFFFFFF
+	detect_order = 2
+	family = 'eight'
+
+	def code_to_int(self, code):
+		return snes_code_to_int(code)
+
+	def format(self, n, length):
+		return snes_int_to_code(n)
+
+	def decode(self, code):
+		code = self.normalize(code)
+		if len(code) != 8:
+			raise InvalidCode(self.title + ' Game Genie codes are 8 digits long')
+		n, flags = snes_code_to_int(code)
+		if flags & SNES_BAD:
+			raise InvalidCode(self.title + ' Game Genie codes cannot contain spaces')
+		if flags & SNES_NOT_HEX:
+			raise NotHexCode(self.title + ' Game Genie codes are hexadecimal')
+
+		decoded = snes_decode(n)
+		return DecodeResult(self.name, n, 8, decoded >> 8, decoded & 255, None, 0, None)
+
+	def encode(self, address, value, condition = None):
+		self.check(address, value, condition)
+		return EncodeResult(self.name, snes_encode(address, value), 8, address, value, None, 0)
+
+class MegaPlatform(Platform):
+	name = 'mega'
+	title = 'Sega Mega Drive'
+	short_title = 'Mega Drive'
+	lengths = (8,)
+	group = 4
+	address_digits = 6
+	value_digits = 4
+	last_address = 0x3FFFFF # the cartridge ROM, the Game Genie can't patch anything above it
+	detect_order = 3
+	family = 'eight'
+
+	def code_to_int(self, code):
+		return mega_code_to_int(code)
+
+	def format(self, n, length):
+		return mega_int_to_code(n)
+
+	def decode(self, code):
+		code = self.normalize(code)
+		if len(code) != 8:
+			raise InvalidCode(self.title + ' Game Genie codes are 8 characters long')
+		n, flags = mega_code_to_int(code)
+		if flags:
+			raise InvalidCode(self.title + ' Game Genie codes can only contain ' + MEGA_ALPHABET)
+
+		# codes for anything above the ROM (work RAM at $FF0000 and the rest) are RAM codes,
+		# encode() won't make them
+		decoded = mega_decode(n)
+		address = decoded >> 16
+		return DecodeResult(self.name, n, 8, address, decoded & 0xFFFF, None, RAM if address > self.last_address else 0, None)
+
+	def encode(self, address, value, condition = None):
+		self.check(address, value, condition)
+		return EncodeResult(self.name, mega_encode(address, value), 8, address, value, None, 0)
+
+
+def register(platform):
+	PLATFORMS[platform.name] = platform
+	NAMES[platform.name] = platform.title
+	SHORT_NAMES[platform.name] = platform.short_title
+	LENGTHS[platform.name] = platform.lengths
+	ADDRESS_DIGITS[platform.name] = platform.address_digits
+	VALUE_DIGITS[platform.name] = platform.value_digits
+	# in place, it's detect()'s default
+	DETECT[:] = sorted((name for name in PLATFORMS if PLATFORMS[name].detect_order is not None), key = lambda name: PLATFORMS[name].detect_order)
+
+	return platform
+
+for platform in (NESPlatform(), GBPlatform(), GearPlatform(), SNESPlatform(), MegaPlatform()):
+	register(platform)
+del platform
+
+# the SNES/Mega Drive tables under their old names, e.g. codec.SNES_DECODE
+_LAZY = {'SNES_NIBBLES': (_snes, 'NIBBLES'), 'SNES_PAIRS': (_snes, 'PAIRS'), 'SNES_DECODE': (_snes, 'DECODE'), 'SNES_ENCODE': (_snes, 'ENCODE'),
+	'MEGA_CHARS': (_mega, 'CHARS'), 'MEGA_PAIRS': (_mega, 'PAIRS'), 'MEGA_DECODE': (_mega, 'DECODE'), 'MEGA_ENCODE': (_mega, 'ENCODE')}
+
+def __getattr__(name):
+	if name in _LAZY: return getattr(*_LAZY[name])
+	raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+
+def get(platform):
+	try: return PLATFORMS[platform]
+	except KeyError: raise UnsupportedPlatform('unknown platform: ' + repr(platform)) from None
+
+# the name of the first platform whose codes look exactly like this one (a code that fits several,
+# like 12345678 for SNES and Mega Drive, goes to the first), or failing that the first one that
+# can still decode it (e.g. an NES code with a bad letter); None if no platform can
+def detect(code, platforms = DETECT):
+	code = code.strip()
+	for platform in platforms:
+		if PLATFORMS[platform].match(code) is not None:
+			return platform
+
+	# the class's decode(), not the one instrument may have swapped in, as these are only tries
+	for platform in platforms:
+		try: type(PLATFORMS[platform]).decode(PLATFORMS[platform], code)
+		except InvalidCode: continue
+		return platform
+
+	return None
+
+def decode(platform, code):
+	return get(platform).decode(code)
+
+def encode(platform, address, value, condition = None):
+	return get(platform).encode(address, value, condition)
@@ -0,0 +1,183 @@
+# optional timings and counters for the codec, to see where the time of a slow batch goes
+# nothing here runs until enable() is called (or GGWORKSHOP_STATS is set when ggworkshop is imported):
+# enable() swaps timed wrappers in for the codec/batch functions, disable() puts the originals back,
+# so when it's off the codec is exactly as fast as without this module
+#
+# stages (time spent in the stage itself, not in the stages it calls):
+# rows        batch/audit rows: splitting lines, parsing hex, guessing platforms, cache lookups
+# validation  decode()/encode(): normalizing, length and range checks, building the result
+# letters     letters/digits to numbers (nes_code_to_int()...)
+# bits        moving the bits around (nes_decode6(), gb_encode9()...)
+# format      codes and hex strings for the csv/json output (batch.expand())
+# output      the csv/json/bin writers, including reading the input they pull through
+#
+# counters: decoded, encoded, rejected, invalid_letters (NES), check_failures (GB/Game Gear 9-digit
+# codes), ram; these count rows (batch.decode_row()/encode_row(), which serve uses too, and
+# audit.Audit.check()), so every code is counted once, whether it came from a cache.Cache or not
+
+import time
+import threading
+
+from . import audit, batch, codec
+
+STAGES = ('rows', 'validation', 'letters', 'bits', 'format', 'output')
+COUNTERS = ('decoded', 'encoded', 'rejected', 'invalid_letters', 'check_failures', 'ram')
+
+# codec functions by stage
+LETTERS = ('nes_code_to_int', 'gb_code_to_int', 'snes_code_to_int', 'mega_code_to_int')
+BITS = ('nes_decode6', 'nes_decode8', 'nes_encode6', 'nes_encode8', 'gb_decode6', 'gb_decode9', 'gb_encode6', 'gb_encode9', 'snes_decode', 'snes_encode', 'mega_decode', 'mega_encode')
+
+enabled = False
+
+# every thread counts into its own dicts, so the wrappers don't need a lock; snapshot() adds them up
+class _Numbers(object):
+	def __init__(self):
+		self.times = dict.fromkeys(STAGES, 0) # nanoseconds
+		self.calls = dict.fromkeys(STAGES, 0)
+		self.counters = dict.fromkeys(COUNTERS, 0)
+		self.stack = [] # [stage, time spent in the stages it called] of the stages running now
+
+_lock = threading.Lock()
+_local = threading.local()
+_threads = []
+_originals = [] # (object, name, original), to undo enable()
+
+def _numbers():
+	try: return _local.numbers
+	except AttributeError:
+		_local.numbers = _Numbers()
+		with _lock: _threads.append(_local.numbers)
+		return _local.numbers
+
+def _count(name):
+	_numbers().counters[name] += 1
+
+def _timed(stage, func):
+	def timed(*args, **kwargs):
+		numbers = _numbers()
+		stack = numbers.stack
+		# gb_encode9() calls gb_encode6(), that's still one piece of bit moving
+		if stack and stack[-1][0] == stage: return func(*args, **kwargs)
+
+		frame = [stage, 0]
+		stack.append(frame)
+		start = time.perf_counter_ns()
+		try: return func(*args, **kwargs)
+		finally:
+			elapsed = time.perf_counter_ns() - start
+			stack.pop()
+			if stack: stack[-1][1] += elapsed
+			numbers.times[stage] += elapsed - frame[1]
+			numbers.calls[stage] += 1
+
+	timed.__wrapped__ = func
+	return timed
+
+# result is None for a rejected code
+def _tally(counter, result):
+	if result is None:
+		_count('rejected')
+		return
+
+	_count(counter)
+	if result.flags & codec.INVALID: _count('invalid_letters' if result.platform == 'nes' else 'check_failures')
+	if result.flags & codec.RAM: _count('ram')
+
+def _row(func):
+	def counted(*args, **kwargs):
+		row = func(*args, **kwargs)
+		_tally('decoded' if row[1] == 'decode' else 'encoded', row[4])
+		return row
+
+	return _timed('rows', counted)
+
+def _audit_row(check):
+	def counted(self, number, code):
+		row = check(self, number, code)
+		_tally('decoded', row.result)
+		return row
+
+	return _timed('rows', counted)
+
+def _swap(owner, name, replacement):
+	_originals.append((owner, name, owner.__dict__.get(name)))
+	setattr(owner, name, replacement)
+
+def enable():
+	global enabled
+	if enabled: return
+	enabled = True
+
+	for name in LETTERS:
+		_swap(codec, name, _timed('letters', getattr(codec, name)))
+	for name in BITS:
+		_swap(codec, name, _timed('bits', getattr(codec, name)))
+	# on the platform objects, so decode()/encode() called any way are timed
+	for platform in codec.PLATFORMS.values():
+		_swap(platform, 'decode', _timed('validation', platform.decode))
+		_swap(platform, 'encode', _timed('validation', platform.encode))
+
+	_swap(batch, 'decode_row', _row(batch.decode_row))
+	_swap(batch, 'encode_row', _row(batch.encode_row))
+	_swap(audit.Audit, 'check', _audit_row(audit.Audit.check))
+	_swap(batch, 'expand', _timed('format', batch.expand))
+	for name, writer in list(batch.WRITERS.items()):
+		batch.WRITERS[name] = _timed('output', writer)
+		_originals.append((batch.WRITERS, name, writer))
+
+def disable():
+	global enabled
+	while _originals:
+		owner, name, original = _originals.pop()
+		if isinstance(owner, dict): owner[name] = original
+		elif original is None: delattr(owner, name) # was a method of the class
+		else: setattr(owner, name, original)
+	enabled = False
+
+def _reset():
+	for numbers in _threads:
+		for stage in STAGES:
+			numbers.times[stage] = numbers.calls[stage] = 0
+		for name in COUNTERS:
+			numbers.counters[name] = 0
+
+def _snapshot():
+	stages = {stage: {'calls': sum(numbers.calls[stage] for numbers in _threads), 'seconds': sum(numbers.times[stage] for numbers in _threads) / 1e9} for stage in STAGES}
+	counters = {name: sum(numbers.counters[name] for numbers in _threads) for name in COUNTERS}
+	return {'enabled': enabled, 'stages': stages, 'counters': counters}
+
+def reset():
+	with _lock: _reset()
+
+def snapshot():
+	with _lock: return _snapshot()
+
+# snapshot() and reset() in one go, so nothing is counted twice
+def take():
+	with _lock:
+		stats = _snapshot()
+		_reset()
+
+	return stats
+
+# adds a snapshot (e.g. from a worker process) to the numbers here
+def merge(stats):
+	numbers = _numbers()
+	for stage, stage_numbers in stats['stages'].items():
+		numbers.times[stage] += round(stage_numbers['seconds'] * 1e9)
+		numbers.calls[stage] += stage_numbers['calls']
+	for name, count in stats['counters'].items():
+		numbers.counters[name] += count
+
+def report(stats = None):
+	if stats is None: stats = snapshot()
+	total = sum(numbers['seconds'] for numbers in stats['stages'].values())
+
+	lines = ['{0:<12} {1:>12} {2:>10} {3:>7} {4:>10}'.format('stage', 'calls', 'seconds', 'share', 'us/call')]
+	for stage, numbers in stats['stages'].items():
+		calls, seconds = numbers['calls'], numbers['seconds']
+		lines.append('{0:<12} {1:12} {2:10.3f} {3:7.1%} {4:10.2f}'.format(stage, calls, seconds, seconds / total if total else 0.0, seconds / calls * 1e6 if calls else 0.0))
+	lines.append('')
+	lines.extend('{0:<16} {1:12}'.format(name, count) for name, count in stats['counters'].items())
+
+	return '\n'.join(lines) + '\n'
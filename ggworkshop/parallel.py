@@ -0,0 +1,79 @@
+# multi-process versions of the batch jobs
+# input is cut into chunks that run in a process pool, results come back in input order
+# and only a few chunks are in flight at a time, so memory stays bounded
+
+import os
+import itertools
+import collections
+from concurrent.futures import ProcessPoolExecutor
+
+from . import batch, codec, tables, cache, instrument
+
+# each worker's own result cache, if there is one
+_cache = None
+
+def _init(cache_size = 0, stats = False):
+	global _cache
+	# every worker maps the same lookup table file (if there is one), so the pages are shared
+	tables.install()
+	if cache_size: _cache = cache.Cache(cache_size)
+	if stats: instrument.enable()
+
+def imap(func, items, jobs = None, window = None, cache_size = 0):
+	jobs = jobs or os.cpu_count() or 1
+	window = window or jobs * 2
+
+	pool = ProcessPoolExecutor(jobs, initializer = _init, initargs = (cache_size, instrument.enabled))
+	try:
+		pending = collections.deque()
+		for item in items:
+			pending.append(pool.submit(func, item))
+			if len(pending) >= window:
+				yield pending.popleft().result()
+		while pending:
+			yield pending.popleft().result()
+	finally:
+		pool.shutdown(cancel_futures = True)
+
+def chunks(lines, size):
+	lines = iter(lines)
+	start = 1
+	while True:
+		chunk = list(itertools.islice(lines, size))
+		if not chunk: return
+		yield start, chunk
+		start += len(chunk)
+
+# with instrumentation on, each chunk brings the worker's numbers back with it
+def _process_chunk(job):
+	platform, start, lines = job
+	rows = list(batch.process(platform, lines, start, _cache))
+	return rows, instrument.take() if instrument.enabled else None
+
+# same rows as batch.process(), cache_size is the size of each worker's cache.Cache (0 for none)
+def process(platform, lines, jobs = None, chunk_size = 5000, cache_size = 0):
+	for rows, stats in imap(_process_chunk, ((platform, start, chunk) for start, chunk in chunks(lines, chunk_size)), jobs, cache_size = cache_size):
+		if stats: instrument.merge(stats)
+		yield from rows
+
+def _encode_block(job):
+	platform, address, values, conditions = job
+	rows = []
+	for value in range(values):
+		for condition in conditions:
+			rows.append((address, value, condition, codec.encode(platform, address, value, condition).code))
+
+	return rows
+
+def _encode_space(platform, first, last, values, conditions, jobs):
+	for rows in imap(_encode_block, ((platform, address, values, conditions) for address in range(first, last + 1)), jobs):
+		yield from rows
+
+# every code for every value (and every condition if conditions is True) of the addresses first..last
+# yields (address, value, condition, code), one address per chunk
+def encode_space(platform, first, last, conditions = False, jobs = None):
+	platform = codec.get(platform)
+	if conditions and len(platform.lengths) == 1:
+		raise ValueError(platform.title + ' Game Genie codes cannot have a condition')
+
+	return _encode_space(platform.name, first, last, 1 << platform.value_digits * 4, range(256) if conditions else (None,), jobs)
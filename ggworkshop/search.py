@@ -0,0 +1,74 @@
+# reverse search: every code for an address range, or the codes in a list that hit one
+# both are generators, nothing is built for codes that don't match
+
+from . import codec, batch
+
+# "C000" or "C000-C0FF"
+def parse_hex_range(text, digits, name):
+	first, sep, last = text.partition('-')
+	first = batch.parse_hex(first, digits, name)
+	last = batch.parse_hex(last, digits, name) if sep else first
+	if last < first:
+		raise ValueError('{0} range is backwards: {1}'.format(name, text))
+
+	return first, last
+
+# "09", "09,0A" or "00-0F,80"
+def parse_hex_set(text, digits, name):
+	items = set()
+	for part in text.split(','):
+		first, last = parse_hex_range(part, digits, name)
+		items.update(range(first, last + 1))
+
+	return sorted(items)
+
+def _encode_range(platform, first, last, values, conditions):
+	encode = platform.encode
+	for address in range(first, last + 1):
+		for value in values:
+			for condition in conditions:
+				yield encode(address, value, condition)
+
+# an iterator of EncodeResults for every address in first..last and every value/condition given
+# (all of them if None); long codes (8 letters / 9 digits) are generated if length is the longer one
+# bad arguments raise right away instead of on the first next()
+def encode_range(platform, first, last, values = None, conditions = None, length = None):
+	platform = codec.get(platform)
+	if length is None: length = platform.lengths[0]
+	if length not in platform.lengths:
+		raise ValueError('{0} Game Genie codes can\'t be {1} characters long'.format(platform.title, length))
+
+	if values is None: values = range(1 << platform.value_digits * 4)
+	if length == platform.lengths[0]:
+		if conditions is not None:
+			raise ValueError('{0}-character {1} Game Genie codes cannot have a condition'.format(length, platform.title))
+		conditions = (None,)
+	elif conditions is None: conditions = range(256)
+
+	platform.encode(first, 0)
+	platform.encode(last, 0)
+
+	return _encode_range(platform, first, last, values, conditions)
+
+# just the address of a code, None if it's invalid
+def address_of(platform, code):
+	return codec.get(platform).address_of(code)
+
+def _filter_codes(platform, codes, first, last, values, conditions):
+	for code in codes:
+		code = code.strip()
+		address = platform.address_of(code)
+		if address is None or address < first or address > last: continue
+
+		result = platform.decode(code)
+		if values is not None and result.value not in values: continue
+		if conditions is not None and result.condition not in conditions: continue
+		yield result
+
+# an iterator of DecodeResults for every code whose address is in first..last (and value/condition in the given sets)
+def filter_codes(platform, codes, first, last, values = None, conditions = None):
+	platform = codec.get(platform)
+	if values is not None: values = set(values)
+	if conditions is not None: conditions = set(conditions)
+
+	return _filter_codes(platform, codes, first, last, values, conditions)
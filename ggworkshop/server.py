@@ -0,0 +1,218 @@
+# a long-running decode/encode service over HTTP (on a TCP port or a Unix socket), so callers
+# don't pay for starting Python and importing everything for every code
+#
+# POST /decode  {"platform": "nes", "code": "SXIOPO"}
+#               {"platform": "auto", "codes": ["SXIOPO", "DD62-6DAD", ...]}
+# POST /encode  {"platform": "nes", "address": "C000", "value": "09", "condition": "01"}
+#               {"platform": "nes", "rows": [{"address": "C000", "value": "09"}, ...]}
+# GET /         version, platforms, cache counters and instrument.snapshot() (if it is enabled)
+#
+# answers are batch rows (see batch.FIELDS) as JSON objects, a list of them for batched requests
+# "platform" can be left out to use the server's default one
+# connections are kept alive, pipelined requests are answered in order, and only a limited
+# number of requests are worked on at a time
+#
+# run with: python -m ggworkshop.server [address] [platform]  (address: [host:]port or a socket path)
+
+import os
+import sys
+import json
+import asyncio
+
+from . import batch, codec, cache, instrument, version
+
+DEFAULT_ADDRESS = '127.0.0.1:8080'
+MAX_BODY = 16 << 20
+MAX_ITEMS = 100000
+CHUNK = 1000 # items between giving other requests a turn
+
+STATUS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 411: 'Length Required', 413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+class HTTPError(Exception):
+	def __init__(self, status, message, close = False):
+		Exception.__init__(self, message)
+		self.status = status
+		self.close = close # the rest of the connection can't be trusted (e.g. unknown body length)
+
+# ('unix', path) or ('tcp', (host, port))
+def parse_address(text):
+	if text.startswith('unix:'): return 'unix', text[5:]
+	if '/' in text or os.sep in text: return 'unix', text
+
+	host, sep, port = text.rpartition(':')
+	try: port = int(port)
+	except ValueError: raise ValueError('invalid port: ' + text)
+	if not 0 <= port <= 65535:
+		raise ValueError('port must be between 0 and 65535: ' + text)
+
+	return 'tcp', (host.strip('[]') or '127.0.0.1', port)
+
+class Server(object):
+	# cache_size is the number of results kept in a cache.Cache, 0 for none
+	def __init__(self, platform = 'auto', limit = 64, max_body = MAX_BODY, max_items = MAX_ITEMS, cache_size = 65536):
+		if platform != 'auto': codec.get(platform)
+		self.platform = platform
+		self.cache = cache.Cache(cache_size) if cache_size else None
+		self.limit = asyncio.Semaphore(limit)
+		self.max_body = max_body
+		self.max_items = max_items
+
+	def _platform(self, payload):
+		platform = payload.get('platform', self.platform)
+		if not isinstance(platform, str):
+			raise HTTPError(400, 'the platform must be a string')
+		if platform != 'auto' and platform not in codec.PLATFORMS:
+			raise HTTPError(400, 'unknown platform: ' + repr(platform))
+		return platform
+
+	def _items(self, payload, single, many):
+		if single in payload: return False, [payload[single]]
+
+		items = payload.get(many)
+		if not isinstance(items, list):
+			raise HTTPError(400, 'give either "{0}" or a "{1}" list'.format(single, many))
+		if len(items) > self.max_items:
+			raise HTTPError(413, 'at most {0} items per request'.format(self.max_items))
+		return True, items
+
+	async def _rows(self, func, platform, items):
+		rows = []
+		for number, item in enumerate(items, 1):
+			rows.append(dict(zip(batch.FIELDS, batch.expand(func(platform, number, item, self.cache)))))
+			if number % CHUNK == 0: await asyncio.sleep(0)
+
+		return rows
+
+	async def decode(self, payload):
+		platform = self._platform(payload)
+		many, codes = self._items(payload, 'code', 'codes')
+		if not all(isinstance(code, str) for code in codes):
+			raise HTTPError(400, 'codes are strings')
+
+		rows = await self._rows(batch.decode_row, platform, codes)
+		return rows if many else rows[0]
+
+	async def encode(self, payload):
+		platform = self._platform(payload)
+		many, items = self._items(payload, 'address', 'rows')
+		if not many: items = [payload]
+
+		rows = []
+		for item in items:
+			if not isinstance(item, dict) or 'address' not in item or 'value' not in item:
+				raise HTTPError(400, 'encode rows need an "address" and a "value"')
+			fields = [item['address'], item['value']] + ([item['condition']] if item.get('condition') is not None else [])
+			if not all(isinstance(field, str) for field in fields):
+				raise HTTPError(400, 'addresses, values and conditions are hex strings')
+			rows.append(fields)
+
+		rows = await self._rows(batch.encode_row, platform, rows)
+		return rows if many else rows[0]
+
+	async def _read_request(self, reader):
+		try:
+			line = await reader.readline()
+			if not line: return None
+			try: method, target, http = line.decode('latin-1').split()
+			except ValueError: raise HTTPError(400, 'bad request line', True)
+
+			headers = {}
+			while True:
+				line = await reader.readline()
+				if line in (b'\r\n', b'\n', b''): break
+				name, sep, value = line.decode('latin-1').partition(':')
+				headers[name.strip().lower()] = value.strip()
+		except (ValueError, asyncio.LimitOverrunError):
+			raise HTTPError(400, 'request line or header too long', True)
+
+		if 'transfer-encoding' in headers:
+			raise HTTPError(411, 'send the body with a Content-Length', True)
+		try: length = int(headers.get('content-length', 0))
+		except ValueError: raise HTTPError(400, 'bad Content-Length', True)
+		if length < 0:
+			raise HTTPError(400, 'bad Content-Length', True)
+		if length > self.max_body:
+			raise HTTPError(413, 'requests can be at most {0} bytes'.format(self.max_body), True)
+		body = await reader.readexactly(length) if length else b''
+
+		connection = headers.get('connection', '').lower()
+		keep_alive = connection != 'close' if http == 'HTTP/1.1' else connection == 'keep-alive'
+
+		return method, target.partition('?')[0], body, keep_alive
+
+	async def _answer(self, method, path, body):
+		if path == '/':
+			if method != 'GET': raise HTTPError(405, 'use GET')
+			return {'version': version, 'platforms': list(codec.PLATFORMS), 'default': self.platform, 'cache': None if self.cache is None else self.cache.stats(), 'stats': instrument.snapshot() if instrument.enabled else None}
+
+		if path == '/decode': func = self.decode
+		elif path == '/encode': func = self.encode
+		else: raise HTTPError(404, 'no such path: ' + path)
+		if method != 'POST': raise HTTPError(405, 'use POST')
+
+		try: payload = json.loads(body)
+		except ValueError as e: raise HTTPError(400, 'invalid JSON: ' + str(e))
+		if not isinstance(payload, dict): raise HTTPError(400, 'the payload must be a JSON object')
+
+		async with self.limit:
+			return await func(payload)
+
+	# one connection, requests are read and answered one after another, so pipelined ones keep their order
+	async def handle(self, reader, writer):
+		try:
+			keep_alive = True
+			while keep_alive:
+				try:
+					request = await self._read_request(reader)
+					if request is None: break
+					method, path, body, keep_alive = request
+					status, answer = 200, await self._answer(method, path, body)
+				except HTTPError as e:
+					status, answer = e.status, {'error': str(e)}
+					if e.close: keep_alive = False
+				except (asyncio.IncompleteReadError, ConnectionError):
+					raise
+				except Exception:
+					# a bug, but the client still gets an answer; the connection may be mid-request, so close it
+					import traceback
+					traceback.print_exc()
+					status, answer = 500, {'error': 'internal server error'}
+					keep_alive = False
+
+				data = json.dumps(answer).encode()
+				writer.write('HTTP/1.1 {0} {1}\r\nContent-Type: application/json\r\nContent-Length: {2}\r\nConnection: {3}\r\n\r\n'.format(status, STATUS[status], len(data), 'keep-alive' if keep_alive else 'close').encode() + data)
+				await writer.drain()
+		except (asyncio.IncompleteReadError, ConnectionError):
+			pass
+		finally:
+			writer.close()
+
+async def _serve(address, server, ready = None):
+	kind, where = parse_address(address)
+	if kind == 'unix':
+		if not hasattr(asyncio, 'start_unix_server'):
+			raise ValueError('Unix sockets are not supported on this system')
+		listener = await asyncio.start_unix_server(server.handle, where)
+	else: listener = await asyncio.start_server(server.handle, *where)
+
+	if ready: ready(listener)
+	async with listener:
+		await listener.serve_forever()
+
+# runs until interrupted
+def serve(address = DEFAULT_ADDRESS, platform = 'auto', limit = 64, ready = None, cache_size = 65536):
+	parse_address(address)
+	server = Server(platform, limit, cache_size = cache_size)
+	try: asyncio.run(_serve(address, server, ready))
+	except KeyboardInterrupt: pass
+
+# prints where the server can be reached, for serve(ready = ...)
+def listening(listener):
+	for sock in listener.sockets:
+		name = sock.getsockname()
+		print('Serving on ' + (name if isinstance(name, str) else 'http://{0}:{1}'.format(*name[:2])), flush = True)
+
+if __name__ == '__main__':
+	from . import tables
+	tables.install()
+	serve(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_ADDRESS, sys.argv[2] if len(sys.argv) > 2 else 'auto', ready = listening)
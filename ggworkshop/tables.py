@@ -0,0 +1,96 @@
+# precomputed lookup tables for the 6-letter NES and 6-digit GB/Game Gear code spaces
+# every entry is a little-endian uint32, the file is mmap'd so loading it costs nothing
+# and worker processes share the same pages
+#
+# build the file once with: python -m ggworkshop.tables [path]
+#
+# nes6     code -> address << 8 | value               (16^6 entries)
+# nes6enc  (address - $8000) << 8 | value -> code     (2^23 entries, third letter's high bit clear)
+# gb6      code -> address << 8 | value               (2^24 entries)
+# gb6enc   address << 8 | value -> code               (2^24 entries)
+
+import os
+import sys
+import mmap
+import array
+import struct
+
+from . import codec
+
+VERSION = 1
+MAGIC = b'GGWT'
+HEADER = struct.Struct('<4sHH') # magic, version, number of tables
+ENTRY = struct.Struct('<8sQQ') # name, offset, number of entries
+
+SIZES = {'nes6': 1 << 24, 'nes6enc': 1 << 23, 'gb6': 1 << 24, 'gb6enc': 1 << 24}
+
+def default_path():
+	path = os.environ.get('GGWORKSHOP_TABLES')
+	if path: return path
+
+	return os.path.join(os.path.expanduser('~'), '.cache', 'ggworkshop', 'tables-v{0}.bin'.format(VERSION))
+
+def _generate(name):
+	if name == 'nes6': return array.array('I', map(codec.nes_decode6, range(SIZES[name])))
+	elif name == 'nes6enc': return array.array('I', map(lambda key: codec.nes_encode6(key >> 8 | 0x8000, key & 255), range(SIZES[name])))
+	elif name == 'gb6': return array.array('I', map(codec.gb_decode6, range(SIZES[name])))
+	elif name == 'gb6enc': return array.array('I', map(lambda key: codec.gb_encode6(key >> 8, key & 255), range(SIZES[name])))
+
+def build(path = None):
+	if path is None: path = default_path()
+	if os.path.dirname(path): os.makedirs(os.path.dirname(path), exist_ok = True)
+
+	names = sorted(SIZES)
+	offset = HEADER.size + ENTRY.size * len(names)
+	with open(path + '.tmp', 'wb') as f:
+		f.write(HEADER.pack(MAGIC, VERSION, len(names)))
+		for name in names:
+			f.write(ENTRY.pack(name.encode(), offset, SIZES[name]))
+			offset += 4 * SIZES[name]
+
+		for name in names:
+			table = _generate(name)
+			if sys.byteorder == 'big': table.byteswap()
+			table.tofile(f)
+	os.replace(path + '.tmp', path)
+
+	return path
+
+class Tables(object):
+	def __init__(self, path):
+		if sys.byteorder == 'big':
+			raise ValueError('lookup tables are only supported on little-endian machines')
+
+		with open(path, 'rb') as f:
+			self._mmap = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+
+		if len(self._mmap) < HEADER.size:
+			raise ValueError('not a GGWorkshop table file: ' + path)
+		magic, version, count = HEADER.unpack_from(self._mmap)
+		if magic != MAGIC or version != VERSION:
+			raise ValueError('not a version {0} GGWorkshop table file: {1}'.format(VERSION, path))
+
+		view = memoryview(self._mmap)
+		for i in range(count):
+			name, offset, length = ENTRY.unpack_from(self._mmap, HEADER.size + ENTRY.size * i)
+			name = name.rstrip(b'\0').decode()
+			if name not in SIZES or length != SIZES[name] or offset + 4 * length > len(self._mmap):
+				raise ValueError('corrupted GGWorkshop table file: ' + path)
+			setattr(self, name, view[offset:offset + 4 * length].cast('I'))
+
+		for name in SIZES:
+			if not hasattr(self, name):
+				raise ValueError('incomplete GGWorkshop table file: ' + path)
+
+def load(path = None):
+	try: return Tables(path or default_path())
+	except (OSError, ValueError): return None
+
+# makes codec.decode()/encode() use the tables, returns False (and keeps computing) if there aren't any
+def install(path = None):
+	codec.backend = load(path)
+	return codec.backend is not None
+
+if __name__ == '__main__':
+	print('Building lookup tables, this takes a while...')
+	print('Saved to ' + build(sys.argv[1] if len(sys.argv) > 1 else None))
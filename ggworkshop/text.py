@@ -0,0 +1,48 @@
+# what the text output of encode/decode says about a code, made from the result alone so main.py's
+# interfaces and the fast path of python -m ggworkshop print exactly the same thing
+
+from . import codec
+
+# the note for codes that fail the platform's check, by Platform.family
+INVALID_NOTES = {
+	'nes': '\nThis code contains INVALID letters and will NOT work on a real {0} Game Genie.\nTo use this code on real hardware, use this replacement code: {2}',
+	'gb': '\nThis code will NOT work on a real {0} Game Genie because it did not pass the 8th character check.\nTo use this code on real hardware, use this replacement code: {2}'
+}
+
+def _ram_note(platform):
+	return '\nThis code will NOT work on a real {0} Game Genie because it modifies RAM,\nand the fact that a real {1} Game Genie will mark the code as "invalid".\nBut it WILL work on a {1} emulator.'.format(codec.NAMES[platform], codec.SHORT_NAMES[platform])
+
+# ram: whether to add the RAM code note (the caller knows if it was asked for)
+def decoded(result, ram = False):
+	address, value, condition = result.hex()
+	lines = ['{0} Game Genie code decoded successfully.\n\nCode: {1}'.format(codec.NAMES[result.platform], result.code)]
+
+	if ram:
+		lines.append(_ram_note(result.platform))
+		if result.invalid: lines.append('This code also did not pass the 8th character check, but a replacement code\nwould just be marked "invalid" anyway.')
+	elif result.invalid:
+		lines.append(INVALID_NOTES[codec.get(result.platform).family].format(codec.NAMES[result.platform], codec.SHORT_NAMES[result.platform], result.replacement))
+
+	if condition is None: lines.append('\nAddress: {0}\nValue: {1}\n\nThis code will substitute the value at ${0} with #${1}.'.format(address, value))
+	elif value == condition: lines.append('\nAddress: {0}\nCondition: {1}\nValue: {2}\n\nThis code does NOTHING! What a useless code.'.format(address, condition, value))
+	else: lines.append('\nAddress: {0}\nCondition: {1}\nValue: {2}\n\nIf the value at ${0} is equal to #${1},\nthis code will substitute it with #${2}.'.format(address, condition, value))
+
+	return '\n'.join(lines)
+
+def encoded(result, ram = False):
+	address, value, condition = result.hex()
+	codes = result.codes
+	lines = ['{0} Game Genie code generated successfully.'.format(codec.NAMES[result.platform])]
+	if ram: lines.append(_ram_note(result.platform))
+
+	if condition is None:
+		lines.append('\nAddress: {0}\nValue: {1}\n'.format(address, value))
+	else:
+		lines.append('\nAddress: {0}\nCondition: {1}\nValue: {2}\n'.format(address, condition, value))
+	lines.append(('Codes: ' if len(codes) > 1 else 'Code: ') + ', '.join(codes) + '\n')
+
+	if condition is None: lines.append('This code will substitute the value at ${0} with #${1}.'.format(address, value))
+	elif value == condition: lines.append('This code does NOTHING! Why do you even bother generating such a useless code?')
+	else: lines.append('If the value at ${0} is equal to #${1},\nthis code will substitute it with #${2}.'.format(address, condition, value))
+
+	return '\n'.join(lines)
@@ -0,0 +1,242 @@
+# whole-array versions of the codec, needs NumPy
+# codes go in as fixed-width byte strings (e.g. np.dtype('S8')), one row per code,
+# and come out as a structured array with the same flags DecodeResult has
+
+import numpy as np
+
+from . import codec
+
+DECODED = np.dtype([
+	('address', '<u4'),
+	('value', '<u2'),
+	('condition', '<i2'), # -1 if the code has no condition
+	('length', 'u1'),
+	('valid', '?'), # False if the code was rejected, all other fields are 0 then
+	('invalid', '?'), # invalid NES letters / failed GB 8th character check
+	('ram', '?')
+])
+
+NES_TABLE = np.array(codec.NES_NIBBLES, np.uint8)
+NES_LETTERS = np.frombuffer(codec.NES_ALPHABET.encode(), np.uint8)
+GB_TABLE = np.array(codec.GB_NIBBLES, np.uint8)
+GB_LETTERS = np.frombuffer(codec.GB_DIGITS.encode(), np.uint8)
+
+# SNES and Mega Drive codes are all 8 characters, bits are moved with the codec's per-byte tables
+EIGHT = {
+	'snes': (np.array(codec.SNES_NIBBLES, np.uint8), 4, np.array(codec.SNES_DECODE, np.uint64), np.array(codec.SNES_ENCODE, np.uint64), np.frombuffer(codec.SNES_DIGITS.encode(), np.uint8)),
+	'mega': (np.array(codec.MEGA_CHARS, np.uint8), 5, np.array(codec.MEGA_DECODE, np.uint64), np.array(codec.MEGA_ENCODE, np.uint64), np.frombuffer(codec.MEGA_ALPHABET.encode(), np.uint8))
+}
+
+def _rows(codes, width):
+	codes = np.ascontiguousarray(codes)
+	if codes.dtype.kind != 'S': codes = codes.astype('S')
+	codes = codes.reshape(-1)
+
+	size = codes.dtype.itemsize
+	raw = np.zeros((len(codes), max(width, size)), np.uint8)
+	raw[:, :size] = codes.view(np.uint8).reshape(len(codes), size)
+
+	return raw, np.char.str_len(codes)
+
+def _flags(nibbles, length):
+	inside = np.arange(nibbles.shape[1]) < length[:, None]
+	return np.bitwise_or.reduce(nibbles * inside, axis = 1)
+
+def nes_decode(codes):
+	raw, length = _rows(codes, 8)
+	nibbles = NES_TABLE[raw[:, :8]]
+	flags = _flags(nibbles, length)
+	valid = ((length == 6) | (length == 8)) & (flags & codec.NES_BAD == 0)
+
+	n = (nibbles & 15).astype(np.uint32).T
+	eight = length == 8
+
+	result = np.zeros(len(raw), DECODED)
+	result['address'] = 0x8000 | (n[3] & 7) << 12 | (n[4] & 8 | n[5] & 7) << 8 | (n[1] & 8 | n[2] & 7) << 4 | n[3] & 8 | n[4] & 7
+	result['value'] = (n[0] & 8 | n[1] & 7) << 4 | np.where(eight, n[7], n[5]) & 8 | n[0] & 7
+	result['condition'] = np.where(eight, (n[6] & 8 | n[7] & 7) << 4 | n[5] & 8 | n[6] & 7, -1)
+	result['length'] = length
+	result['valid'] = valid
+	result['invalid'] = flags & codec.NES_INVALID != 0
+	result[~valid] = 0
+
+	return result
+
+# squeezes the dashes out, keeping the order of everything else
+def _undash(raw, length):
+	dash = raw == ord('-')
+	if not dash.any(): return raw, length
+
+	order = np.argsort(dash, axis = 1, kind = 'stable')
+	raw = np.take_along_axis(raw, order, 1)
+	raw[np.take_along_axis(dash, order, 1)] = 0
+
+	return raw, length - dash.sum(1)
+
+def _permute(tables, n):
+	out = np.zeros(len(n), np.uint64)
+	for byte, table in enumerate(tables):
+		out |= table[(n >> np.uint64(byte * 8) & np.uint64(255)).astype(np.intp)]
+
+	return out
+
+def gb_decode(platform, codes):
+	raw, length = _undash(*_rows(codes, 11))
+
+	nibbles = GB_TABLE[raw[:, :9]]
+	flags = _flags(nibbles, length)
+	valid = ((length == 6) | (length == 9)) & (flags & (codec.GB_NOT_HEX | codec.GB_BAD) == 0)
+
+	d = (nibbles & 15).astype(np.uint32).T
+	nine = length == 9
+	check = d[8] << 4 | d[6]
+
+	result = np.zeros(len(raw), DECODED)
+	result['address'] = (d[5] ^ 15) << 12 | d[2] << 8 | d[3] << 4 | d[4]
+	result['value'] = d[0] << 4 | d[1]
+	result['condition'] = np.where(nine, (check << 2 | check >> 6) & 255 ^ 0xBA, -1)
+	result['length'] = length
+	result['valid'] = valid
+	result['invalid'] = nine & (d[7] != d[6] ^ 8)
+	result['ram'] = d[5] < codec.GB_ROM_DIGIT[platform]
+	result[~valid] = 0
+
+	return result
+
+def eight_decode(platform, codes):
+	chars, bits, decode_tables, encode_tables, letters = EIGHT[platform]
+	raw, length = _undash(*_rows(codes, 9))
+
+	values = chars[raw[:, :8]]
+	flags = _flags(values, length)
+	valid = (length == 8) & (flags >> bits == 0)
+
+	n = np.zeros(len(raw), np.uint64)
+	for i in range(8):
+		n = n << np.uint64(bits) | (values[:, i] & (1 << bits) - 1).astype(np.uint64)
+	decoded = _permute(decode_tables, n)
+
+	shift = np.uint64(codec.VALUE_DIGITS[platform] * 4)
+	result = np.zeros(len(raw), DECODED)
+	result['address'] = decoded >> shift
+	result['value'] = decoded & (np.uint64(1) << shift) - np.uint64(1)
+	result['condition'] = -1
+	result['length'] = length
+	result['valid'] = valid
+	result['ram'] = valid & (result['address'] > codec.get(platform).last_address)
+	result[~valid] = 0
+
+	return result
+
+ENCODED = np.dtype([
+	('code', 'S11'), # GB/Game Gear codes come with dashes
+	('alt_code', 'S11'), # empty for GB/Game Gear
+	('valid', '?'),
+	('ram', '?')
+])
+
+def nes_encode(address, value, condition = None):
+	address = np.asarray(address, np.int64).reshape(-1)
+	value = np.asarray(value, np.int64).reshape(-1)
+	if condition is None: condition = np.full(len(address), -1, np.int64)
+	else: condition = np.asarray(condition, np.int64).reshape(-1)
+
+	valid = (address >= 0x8000) & (address <= 0xFFFF) & (value >= 0) & (value <= 255) & (condition <= 255)
+	eight = condition >= 0
+
+	a0 = address >> 12 & 15; a1 = address >> 8 & 15; a2 = address >> 4 & 15; a3 = address & 15
+	v0 = value >> 4 & 15; v1 = value & 15
+	c0 = condition >> 4 & 15; c1 = condition & 15
+
+	nibbles = np.empty((len(address), 8), np.uint8)
+	nibbles[:, 0] = v0 & 8 | v1 & 7
+	nibbles[:, 1] = a2 & 8 | v0 & 7
+	nibbles[:, 2] = a2 & 7
+	nibbles[:, 3] = a3 & 8 | a0 & 7
+	nibbles[:, 4] = a1 & 8 | a3 & 7
+	nibbles[:, 5] = np.where(eight, c1, v1) & 8 | a1 & 7
+	nibbles[:, 6] = c0 & 8 | c1 & 7
+	nibbles[:, 7] = v1 & 8 | c0 & 7
+
+	result = np.zeros(len(address), ENCODED)
+	for field in ('code', 'alt_code'):
+		letters = NES_LETTERS[nibbles]
+		letters[~eight, 6:] = 0
+		letters[~valid] = 0
+		result[field] = letters.view('S8').reshape(-1)
+		nibbles[:, 2] |= 8
+	result['valid'] = valid
+
+	return result
+
+def gb_encode(platform, address, value, condition = None):
+	address = np.asarray(address, np.int64).reshape(-1)
+	value = np.asarray(value, np.int64).reshape(-1)
+	if condition is None: condition = np.full(len(address), -1, np.int64)
+	else: condition = np.asarray(condition, np.int64).reshape(-1)
+
+	valid = (address >= 0) & (address <= 0xFFFF) & (value >= 0) & (value <= 255) & (condition <= 255)
+	nine = condition >= 0
+
+	check = condition & 255 ^ 0xBA
+	check = (check >> 2 | check << 6) & 255
+
+	# digits and dashes: XXX-XXX-XXX
+	letters = np.zeros((len(address), 11), np.uint8)
+	letters[:, [3, 7]] = ord('-')
+	for i, digit in ((0, value >> 4), (1, value & 15), (2, address >> 8 & 15), (4, address >> 4 & 15), (5, address & 15), (6, address >> 12 & 15 ^ 15), (8, check & 15), (9, check & 15 ^ 8), (10, check >> 4)):
+		letters[:, i] = GB_LETTERS[digit]
+	letters[~nine, 7:] = 0
+	letters[~valid] = 0
+
+	result = np.zeros(len(address), ENCODED)
+	result['code'] = letters.view('S11').reshape(-1)
+	result['valid'] = valid
+	result['ram'] = valid & (address >> 12 & 15 ^ 15 < codec.GB_ROM_DIGIT[platform])
+
+	return result
+
+def eight_encode(platform, address, value, condition = None):
+	if condition is not None: raise ValueError(codec.NAMES[platform] + ' Game Genie codes cannot have a condition')
+	chars, bits, decode_tables, encode_tables, alphabet = EIGHT[platform]
+	address = np.asarray(address, np.int64).reshape(-1)
+	value = np.asarray(value, np.int64).reshape(-1)
+
+	shift = codec.VALUE_DIGITS[platform] * 4
+	valid = (address >= 0) & (address <= codec.get(platform).last_address) & (value >= 0) & (value < 1 << shift)
+	n = _permute(encode_tables, (np.where(valid, address, 0) << shift | np.where(valid, value, 0)).astype(np.uint64))
+
+	# XXXX-XXXX
+	letters = np.zeros((len(address), 9), np.uint8)
+	letters[:, 4] = ord('-')
+	for i, column in enumerate((0, 1, 2, 3, 5, 6, 7, 8)):
+		letters[:, column] = alphabet[(n >> np.uint64(bits * (7 - i)) & np.uint64((1 << bits) - 1)).astype(np.intp)]
+	letters[~valid] = 0
+
+	result = np.zeros(len(address), ENCODED)
+	result['code'] = letters.view('S9').reshape(-1)
+	result['valid'] = valid
+
+	return result
+
+# by Platform.family, all called with the platform first
+DECODERS = {
+	'nes': lambda platform, codes: nes_decode(codes),
+	'gb': gb_decode,
+	'eight': eight_decode
+}
+ENCODERS = {
+	'nes': lambda platform, address, value, condition = None: nes_encode(address, value, condition),
+	'gb': gb_encode,
+	'eight': eight_encode
+}
+
+def decode(platform, codes):
+	family = codec.get(platform).family
+	if family not in DECODERS: raise codec.UnsupportedPlatform('decoding ' + codec.NAMES[platform] + ' Game Genie codes is not supported')
+	return DECODERS[family](platform, codes)
+
+def encode(platform, address, value, condition = None):
+	family = codec.get(platform).family
+	if family not in ENCODERS: raise codec.UnsupportedPlatform('encoding ' + codec.NAMES[platform] + ' Game Genie codes is not supported')
+	return ENCODERS[family](platform, address, value, condition)
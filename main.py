@@ -1,285 +1,57 @@
 import os
 import sys
 import time
-import traceback
-import ctypes
-import msvcrt
 
-version = '0.3.0'
+from ggworkshop import codec, text, version
 
 import argparse
 parser = argparse.ArgumentParser(description = 'Encodes or decodes Game Genie codes on all platforms it has been released in (NES/SNES/GB, etc.)', epilog = 'See README.md for more information.\n\nGGWorkshop {0}\n(c) 2022 GamingWithEvets Inc. All rights reserved.'.format(version), formatter_class=argparse.RawTextHelpFormatter, allow_abbrev = False)
-parser.add_argument('option', choices = ['encode', 'decode'], metavar = '<option>', default = 'decode', help = 'program mode - encode/decode')
-parser.add_argument('platform', choices = ['nes', 'snes', 'gb', 'gear', 'mega'], metavar = '<platform>', default = 'nes', help = 'game genie platform - nes/gb/gear/snes/mega')
-parser.add_argument('address', metavar = '<address/code>', help = 'if "encode" option is used, this is the hex address used for encryption. if not, this is the code used for decryption.')
-parser.add_argument('value', metavar = '<value>', nargs = '?', help = 'hex value used for encryption (MUST BE USED with "encode" option)')
-parser.add_argument('condition', metavar = '<condition>', nargs = '?', help = 'conditional hex value used for encryption (optional; MUST BE USED with "encode" option)')
+parser.add_argument('option', choices = ['encode', 'decode', 'batch', 'search', 'serve', 'audit'], metavar = '<option>', default = 'decode', help = 'program mode - encode/decode/batch/search/serve/audit')
+parser.add_argument('platform', choices = list(codec.PLATFORMS) + ['auto'], metavar = '<platform>', default = 'nes', help = 'game genie platform - nes/gb/gear/snes/mega. with "decode", "batch", "serve" and "audit", auto guesses it from each code')
+parser.add_argument('address', metavar = '<address/code>', help = 'if "encode" option is used, this is the hex address used for encryption. if "batch" or "audit" option is used, this is the file to read (- for stdin). if "search" option is used, this is the hex address or address range (e.g. C000-C0FF). if "serve" option is used, this is the [host:]port or Unix socket path to listen on. if not, this is the code used for decryption.')
+parser.add_argument('value', metavar = '<value>', nargs = '?', help = 'hex value used for encryption (MUST BE USED with "encode" option). with "search", a list of values/ranges (e.g. 09,10-1F)')
+parser.add_argument('condition', metavar = '<condition>', nargs = '?', help = 'conditional hex value used for encryption (optional; MUST BE USED with "encode" option). with "search", a list of conditions/ranges')
 parser.add_argument('-n', '--nologo', action = 'store_true', help = 'skips the logo animation on startup. no need to CTRL+C/CTRL+BREAK.')
-parser.add_argument('-r', '--ramcode', action = 'store_true', help = 'suppresses the RAM code warning when decoding')
+parser.add_argument('-r', '--ramcode', action = 'store_true', help = 'suppresses the RAM code warning when decoding (same as --ram flag)')
+parser.add_argument('-R', '--ram', choices = ['prompt', 'allow', 'flag', 'deny'], help = 'what to do with RAM codes - prompt (default), allow (no note), flag (a note instead of the prompt, default with -H) or deny (exit with status 1)')
+parser.add_argument('-H', '--headless', action = 'store_true', help = 'no logo, screen clearing, window title, prompts or Enter presses, only the result is printed. for scripts and non-Windows systems.')
 parser.add_argument('-a', '--autoexit', action = 'store_true', help = 'skips the Enter presses when exiting. no need to CTRL+C/CTRL+BREAK.')
-args = parser.parse_args()
-if args.option == 'encode':
-	if not args.value:
-		parser.error('the following arguments are required when using "encode" option: <value>')
-
-if args.option == 'encode':
-	try: testval_a = int(args.address, 16)
-	except ValueError: parser.error('invalid hex address: $' + args.address)
-	try: testval_v = int(args.value, 16)
-	except ValueError: parser.error('invalid hex value: #$' + args.value)
-	try:
-		if args.condition: testval_c = int(args.condition, 16)
-	except ValueError: parser.error('invalid conditional hex value: #$' + args.condition)
-
-	if args.platform != 'mega' and args.platform != 'snes':
-		if len(args.address) != 4:
-			parser.error('hex address must be 4 digits for "' + args.platform + '" platform')
-	else:
-		if len(args.address) != 6:
-			parser.error('hex address must be 6 digits for "' + args.platform + '" platform')
-	if len(args.value) != 2:
-		parser.error('hex value must be 2 digits')
-	if args.condition and len(args.condition) != 2:
-		parser.error('conditional hex value must be 2 digits')
-
-	if args.platform != 'mega' and args.platform != 'snes':
-		if testval_a < 32768 or testval_a > 65535:
-			parser.error('hex address must be between $8000 and $FFFF for "' + args.platform + '" platform')
-	else:
-		if args.platform == 'mega':
-			if testval_a < 0 or testval_a > 67108863:
-				parser.error('hex address must be between $000000 and $3FFFFF for "' + args.platform + '" platform')
-	if testval_v < 0 or testval_v > 255:
-		parser.error('hex value must be between #$00 and #$FF')
-	if args.condition and testval_c < 0 or testval_v > 255:
-		parser.error('conditional hex value must be between #$00 and #$FF')
-
-option = args.option
-platform = args.platform
-if option == 'encode':
-	address = args.address
-	value = args.value
-	if args.condition: condition = args.condition
-	else: condition = ''
-elif option == 'decode':
-	code = args.address
-
-ctypes.windll.kernel32.SetConsoleTitleW('GGWorkshop by GamingWithEvets v.' + version)
-
-def codetolist(code):
-	return [char for char in code]
-
-def join(l):
-	converted = ''
-	for bit in l:
-		converted += bit
-
-	return converted
-
-
-class NES():
-	def __init__(self):
-		self.letters = {
-			'A': '0000',
-			'P': '0001',
-			'Z': '0010',
-			'L': '0011',
-			'G': '0100',
-			'I': '0101',
-			'T': '0110',
-			'Y': '0111',
-			'E': '1000',
-			'O': '1001',
-			'X': '1010',
-			'U': '1011',
-			'K': '1100',
-			'S': '1101',
-			'V': '1110',
-			'N': '1111'
-		}
+parser.add_argument('-f', '--format', choices = ['text', 'csv', 'json', 'bin'], help = 'output format - text (default for "encode"/"decode"/"audit"), csv (default for "batch"/"search"), json (JSON Lines) or bin (packed records)')
+parser.add_argument('-L', '--long', action = 'store_true', help = 'makes the "search" option generate 8-letter (NES) or 9-digit (GB/Game Gear) codes')
+parser.add_argument('-i', '--input', metavar = '<file>', help = 'makes the "search" option pick matching codes from this file (- for stdin) instead of generating them')
+parser.add_argument('-j', '--jobs', type = int, metavar = '<jobs>', help = 'number of processes used by the "batch" option (0 = one per CPU core)')
+parser.add_argument('-C', '--cache', type = int, default = 65536, metavar = '<results>', help = 'number of results the "batch" and "serve" options keep for codes that come up again (0 = no cache, default: 65536)')
+parser.add_argument('--stats', action = 'store_true', help = 'prints where the time went (per-stage timings) and counters of decoded/encoded/rejected codes to stderr when done. same as setting GGWORKSHOP_STATS=1')
+parser.add_argument('--profile', metavar = '<file>', help = 'saves a cProfile profile of the run to this file (read it with python -m pstats <file>)')
+parser.add_argument('-c', '--concurrency', type = int, default = 64, metavar = '<requests>', help = 'number of requests the "serve" option works on at a time (default: 64)')
+
+class NES(object):
+	def __init__(self, mode = 'nes'):
+		self.mode = mode
 
 	def invalid_code(self):
 		print('This NES Game Genie code is INVALID!\nCheck the <option> parameter you provided and your code, then try again.')
-		quitter()
+		quitter(1)
 
 	def decoder(self, code):
-		self.code_str = code.upper()
-
-		self.code = codetolist(self.code_str)
-
-		if len(self.code) != 6:
-			if len(self.code) != 8:
-				self.invalid_code()
+		try: result = codec.decode('nes', code)
+		except codec.InvalidCode: self.invalid_code()
 
-		self.code_true = []
-		self.invalid = False
-		for letter in self.code:
-			if letter in list(self.letters.keys()):
-				self.code_true.append(letter)
-			else:
-				self.invalid = True
-				self.code_true.append('A')
-
-		self.code_true_str = join(self.code_true)
-
-		self.code_bin = []
-		for char in self.code:
-			if char.isspace() or char.isnumeric():
-				self.invalid_code()
-
-			i = 1
-			while i != 16:
-				if char.upper() == list(self.letters.keys())[i]:
-					self.code_bin.append(list(self.letters.values())[i])
-					break
-
-				i += 1
-				if i == 16:
-					self.code_bin.append(list(self.letters.values())[0])
-
-		self.bits_bin = []
-		for bits in self.code_bin:
-			self.bits_bin.append(codetolist(bits))
-
-		self.code_reformat = []
-		self.code_reformat.append(['1', self.bits_bin[3][1], self.bits_bin[3][2], self.bits_bin[3][3]])
-		self.code_reformat.append([self.bits_bin[4][0], self.bits_bin[5][1], self.bits_bin[5][2], self.bits_bin[5][3]])
-		self.code_reformat.append([self.bits_bin[1][0], self.bits_bin[2][1], self.bits_bin[2][2], self.bits_bin[2][3]])
-		self.code_reformat.append([self.bits_bin[3][0], self.bits_bin[4][1], self.bits_bin[4][2], self.bits_bin[4][3]])
-		if len(self.code) == 6:
-			self.code_reformat.append([self.bits_bin[0][0], self.bits_bin[1][1], self.bits_bin[1][2], self.bits_bin[1][3]])
-			self.code_reformat.append([self.bits_bin[5][0], self.bits_bin[0][1], self.bits_bin[0][2], self.bits_bin[0][3]])
-		elif len(self.code) == 8:
-			self.code_reformat.append([self.bits_bin[6][0], self.bits_bin[7][1], self.bits_bin[7][2], self.bits_bin[7][3]])
-			self.code_reformat.append([self.bits_bin[5][0], self.bits_bin[6][1], self.bits_bin[6][2], self.bits_bin[6][3]])
-			self.code_reformat.append([self.bits_bin[0][0], self.bits_bin[1][1], self.bits_bin[1][2], self.bits_bin[1][3]])
-			self.code_reformat.append([self.bits_bin[7][0], self.bits_bin[0][1], self.bits_bin[0][2], self.bits_bin[0][3]])
-
-		self.code_reformat_joined = []
-		for item in self.code_reformat:
-			self.code_reformat_joined.append(join(item))
-
-		self.address = ''
-		self.value = ''
-		self.condition = ''
-		for i in range(4):
-			self.address += str(hex(int(self.code_reformat_joined[i], 2))).upper()[2:]
-		if len(self.code) == 8:
-			for i in range(4, 6):
-				self.condition += str(hex(int(self.code_reformat_joined[i], 2))).upper()[2:]
-			for i in range(6, 8):
-				self.value += str(hex(int(self.code_reformat_joined[i], 2))).upper()[2:]
-		elif len(self.code) == 6:
-			for i in range(4, 6):
-				self.value += str(hex(int(self.code_reformat_joined[i], 2))).upper()[2:]
-
-		print('NES Game Genie code decoded successfully.\n\nCode: {0}'.format(self.code_str))
-
-		if self.invalid:
-			print('\nThis code contains INVALID letters and will NOT work on a real NES Game Genie.\nTo use this code on real hardware, use this replacement code: ' + self.code_true_str)
-
-		if len(self.code) == 8:
-			if self.value == self.condition:
-				print('\nAddress: {0}\nCondition: {1}\nValue: {2}\n\nThis code does NOTHING! What a useless code.'.format(self.address, self.condition, self.value))
-			else:
-				print('\nAddress: {0}\nCondition: {1}\nValue: {2}\n\nIf the value at ${0} is equal to #${1},\nthis code will substitute it with #${2}.'.format(self.address, self.condition, self.value))
-		elif len(self.code) == 6:
-			print('\nAddress: {0}\nValue: {1}\n\nThis code will substitute the value at ${0} with #${1}.'.format(self.address, self.value))
+		print(text.decoded(result))
 
 	def encoder(self, address, value, condition):
-		self.address = address.upper()
-		self.condition = condition.upper()
-		self.value = value.upper()
-
-		self.code_bin = []
-		for i in self.address:
-			self.code_bin.append(str(bin(int(i, 16)))[2:].zfill(4))
-		if self.condition:
-			for i in self.condition:
-				self.code_bin.append(str(bin(int(i, 16)))[2:].zfill(4))
-		for i in self.value:
-			self.code_bin.append(str(bin(int(i, 16)))[2:].zfill(4))
-
-		self.bits_bin = []
-		for bits in self.code_bin:
-			self.bits_bin.append(codetolist(bits))
-
-		self.code_reformat = []
-		if not self.condition:
-			self.code_reformat.append([self.bits_bin[4][0], self.bits_bin[5][1], self.bits_bin[5][2], self.bits_bin[5][3]])
-			self.code_reformat.append([self.bits_bin[2][0], self.bits_bin[4][1], self.bits_bin[4][2], self.bits_bin[4][3]])
-		else:
-			self.code_reformat.append([self.bits_bin[6][0], self.bits_bin[7][1], self.bits_bin[7][2], self.bits_bin[7][3]])
-			self.code_reformat.append([self.bits_bin[2][0], self.bits_bin[6][1], self.bits_bin[6][2], self.bits_bin[6][3]])
-		self.code_reformat.append(['0', self.bits_bin[2][1], self.bits_bin[2][2], self.bits_bin[2][3]])
-		self.third_letter_too = ['1', self.bits_bin[2][1], self.bits_bin[2][2], self.bits_bin[2][3]]
-		self.code_reformat.append([self.bits_bin[3][0], self.bits_bin[0][1], self.bits_bin[0][2], self.bits_bin[0][3]])
-		self.code_reformat.append([self.bits_bin[1][0], self.bits_bin[3][1], self.bits_bin[3][2], self.bits_bin[3][3]])
-		self.code_reformat.append([self.bits_bin[5][0], self.bits_bin[1][1], self.bits_bin[1][2], self.bits_bin[1][3]])
-		if self.condition:
-			self.code_reformat.append([self.bits_bin[4][0], self.bits_bin[5][1], self.bits_bin[5][2], self.bits_bin[5][3]])
-			self.code_reformat.append([self.bits_bin[7][0], self.bits_bin[4][1], self.bits_bin[4][2], self.bits_bin[4][3]])
-
-		self.code_reformat_joined = []
-		for item in self.code_reformat:
-			self.code_reformat_joined.append(join(item))
-
-		self.third_letter_too_joined = join(self.third_letter_too)
-		self.third_letter_too_str = list(self.letters.keys())[list(self.letters.values()).index(self.third_letter_too_joined)]
-
-		self.code = []
-		for bits in self.code_reformat_joined:
-			self.code.append(list(self.letters.keys())[list(self.letters.values()).index(bits)])
-		self.code_str = join(self.code)
-		self.code_str_too = self.code_str[:2] + self.third_letter_too_str + self.code_str[3:]
-
-		print('NES Game Genie code generated successfully.')
-		
-
-		if len(self.code) == 8:
-			print('\nAddress: {0}\nCondition: {1}\nValue: {2}\n'.format(self.address, self.condition, self.value))
-			print('Codes: {0}, {1}\n'.format(self.code_str, self.code_str_too))
-			if self.value == self.condition:
-				print('This code does NOTHING! Why do you even bother generating such a useless code?')
-			else:
-				print('If the value at ${0} is equal to #${1},\nthis code will substitute it with #${2}.'.format(self.address, self.condition, self.value))
-		elif len(self.code) == 6:
-			print('\nAddress: {0}\nValue: {1}\n'.format(self.address, self.value))
-			print('Codes: {0}, {1}\n'.format(self.code_str, self.code_str_too))
-			print('This code will substitute the value at ${0} with #${1}.'.format(self.address, self.value))
+		print(text.encoded(codec.encode('nes', int(address, 16), int(value, 16), int(condition, 16) if condition else None)))
 
 class GBGear(object):
 	def __init__(self, mode = 'gb'):
-		self.bintable = {
-			'0': '0000',
-			'1': '0001',
-			'2': '0010',
-			'3': '0011',
-			'4': '0100',
-			'5': '0101',
-			'6': '0110',
-			'7': '0111',
-			'8': '1000',
-			'9': '1001',
-			'A': '1010',
-			'B': '1011',
-			'C': '1100',
-			'D': '1101',
-			'E': '1110',
-			'F': '1111'
-		}
 		self.mode = mode
-		if self.mode == 'gb':
-			self.mode_str = 'Nintendo Game Boy'
-			self.mode_short = 'GB'
-		elif self.mode == 'gear':
-			self.mode_str = 'Sega Game Gear'
-			self.mode_short = 'Game Gear'
-
-	def ram_code(self):
-		if not args.ramcode:
-			print('Wait, no! This code won\'t work on a real ' + self.mode_str + ' Game Genie.\nThis code modifies an address located in RAM, which a real ' + self.mode_short + ' Game Genie cannot do.\nDecode it anyways? [Y: Yes / N: No (Default)] ', end = '')
-			ram_choice = msvcrt.getche()
+		self.mode_str = codec.NAMES[mode]
+		self.mode_short = codec.SHORT_NAMES[mode]
+
+	def ram_code(self, verb = 'Decode'):
+		if args.ram == 'prompt':
+			print('Wait, no! This code won\'t work on a real ' + self.mode_str + ' Game Genie.\nThis code modifies an address located in RAM, which a real ' + self.mode_short + ' Game Genie cannot do.\n' + verb + ' it anyways? [Y: Yes / N: No (Default)] ', end = '')
+			ram_choice = getch()
 			if ram_choice.lower() != b'y':
 				clear()
 				print('Okay! That\'s your choice, then. Ciao!')
@@ -287,147 +59,87 @@ class GBGear(object):
 			else:
 				clear()
 				self.ramcode = True
-		else:
+		elif args.ram == 'deny':
+			print('This code modifies an address located in RAM, which a real ' + self.mode_short + ' Game Genie cannot do.', file = sys.stderr)
+			quitter(1)
+		elif args.ram == 'flag':
 			self.ramcode = True
 
 	def invalid_code(self):
 		print('This ' + self.mode_str + ' Game Genie code is INVALID!\nCheck the <option> parameter you provided and your code, then try again.')
-		quitter()
+		quitter(1)
 
 	def no_hex_code(self):
 		print('This ' + self.mode_str + ' Game Genie code is NOT hexadecimal!\nAll ' + self.mode_short + ' Game Genie codes are hexadecimal, so get a valid code and try again.')
-		quitter()
-
+		quitter(1)
 
 	def decoder(self, code):
 		self.ramcode = False
 
-		self.code_og = code.upper()
-		self.code_str = self.code_og.replace('-', '')
-
-		if len(self.code_str) != 6:
-			if len(self.code_str) != 9:
-				self.invalid_code()
-
-		if len(self.code_str) == 9:
-			self.code_dashes = self.code_str[:3] + '-' + self.code_str[3:6] + '-' + self.code_str[6:10]
-		elif len(self.code_str) == 6:
-			self.code_dashes = self.code_str[:3] + '-' + self.code_str[3:]
-
-		try: testval = int(self.code_str, 16)
-		except: self.no_hex_code()
-
-		self.code = codetolist(self.code_str)
-
-		sixvalid = False
-		if self.mode == 'gb':
-			i = 8
-			while i < 16:
-				if self.code[5] == list(self.bintable.keys())[i]:
-					sixvalid = True
-					break
-				i += 1
-		elif self.mode == 'gear':
-			i = 4
-			while i < 16:
-				if self.code[5] == list(self.bintable.keys())[i]:
-					sixvalid = True
-					break
-				i += 1
-		if not sixvalid: self.ram_code()
-
-		self.code_bin = []
-		for char in self.code:
-			if char.isspace():
-				self.invalid_code()
-			i = 0
-			while i != 16:
-				if char.upper() == list(self.bintable.keys())[i]:
-					self.code_bin.append(list(self.bintable.values())[i])
-					break
-				i += 1
-
-		self.bits_bin = []
-		for bits in self.code_bin:
-			self.bits_bin.append(codetolist(bits))
-
-		self.invalid = False
-		if len(self.code) == 9:
-			eighth = []
-			eighth.extend([str(int(self.bits_bin[6][0]) ^ 1), self.bits_bin[6][1], self.bits_bin[6][2], self.bits_bin[6][3]])
-			if eighth != self.bits_bin[7]:
-				self.invalid = True
-
-			if self.invalid:
-				i = 0
-				while i != 16:
-					if join(eighth) == list(self.bintable.values())[i]:
-						eighth_str = list(self.bintable.keys())[i]
-						break
-					i += 1
-				self.code_true_str = self.code_str[:3] + '-' + self.code_str[3:6] + '-' + self.code_str[6:7] + eighth_str + self.code_str[-1:]
-
-		self.code_reformat = []
-		self.code_reformat.append([str(int(self.bits_bin[5][0]) ^ 1), str(int(self.bits_bin[5][1]) ^ 1), str(int(self.bits_bin[5][2]) ^ 1), str(int(self.bits_bin[5][3]) ^ 1)])
-		self.code_reformat.append([self.bits_bin[2][0], self.bits_bin[2][1], self.bits_bin[2][2], self.bits_bin[2][3]])
-		self.code_reformat.append([self.bits_bin[3][0], self.bits_bin[3][1], self.bits_bin[3][2], self.bits_bin[3][3]])
-		self.code_reformat.append([self.bits_bin[4][0], self.bits_bin[4][1], self.bits_bin[4][2], self.bits_bin[4][3]])
-		if len(self.code) == 9:
-			self.code_reformat.append([str(int(self.bits_bin[8][2]) ^ 1), self.bits_bin[8][3], str(int(self.bits_bin[6][0]) ^ 1), str(int(self.bits_bin[6][1]) ^ 1)])
-			self.code_reformat.append([str(int(self.bits_bin[6][2]) ^ 1), self.bits_bin[6][3], str(int(self.bits_bin[8][0]) ^ 1), self.bits_bin[8][1]])
-		self.code_reformat.append([self.bits_bin[0][0], self.bits_bin[0][1], self.bits_bin[0][2], self.bits_bin[0][3]])
-		self.code_reformat.append([self.bits_bin[1][0], self.bits_bin[1][1], self.bits_bin[1][2], self.bits_bin[1][3]])
-
-		self.code_reformat_joined = []
-		for item in self.code_reformat:
-			self.code_reformat_joined.append(join(item))
-
-		self.address = ''
-		self.value = ''
-		self.condition = ''
-		for i in range(4):
-			self.address += str(hex(int(self.code_reformat_joined[i], 2))).upper()[2:]
-		if len(self.code) == 9:
-			for i in range(4, 6):
-				self.condition += str(hex(int(self.code_reformat_joined[i], 2))).upper()[2:]
-			for i in range(6, 8):
-				self.value += str(hex(int(self.code_reformat_joined[i], 2))).upper()[2:]
-		elif len(self.code) == 6:
-			for i in range(4, 6):
-				self.value += str(hex(int(self.code_reformat_joined[i], 2))).upper()[2:]
-
-		print(self.mode_str + ' Game Genie code decoded successfully.\n\nCode: {0}'.format(self.code_dashes))
-
-		if self.ramcode:
-			print('\nThis code will NOT work on a real ' + self.mode_str + ' Game Genie because it modifies RAM,\nand the fact that a real ' + self.mode_short + ' Game Genie will mark the code as "invalid".\nBut it WILL work on a ' + self.mode_short + ' emulator.')
-			if self.invalid:
-				print('This code also did not pass the 8th character check, but a replacement code\nwould just be marked "invalid" anyway.')
-		elif self.invalid:
-			print('\nThis code will NOT work on a real ' + self.mode_str + ' Game Genie because it did not pass the 8th character check.\nTo use this code on real hardware, use this replacement code: ' + self.code_true_str)
-
-		if len(self.code) == 9:
-			if self.value == self.condition:
-				print('\nAddress: {0}\nCondition: {1}\nValue: {2}\n\nThis code does NOTHING! What a useless code.'.format(self.address, self.condition, self.value))
-			else:
-				print('\nAddress: {0}\nCondition: {1}\nValue: {2}\n\nIf the value at ${0} is equal to #${1},\nthis code will substitute it with #${2}.'.format(self.address, self.condition, self.value))
-		elif len(self.code) == 6:
-			print('\nAddress: {0}\nValue: {1}\n\nThis code will substitute the value at ${0} with #${1}.'.format(self.address, self.value))
+		try: result = codec.decode(self.mode, code)
+		except codec.NotHexCode: self.no_hex_code()
+		except codec.InvalidCode: self.invalid_code()
+
+		if result.ram: self.ram_code()
+		print(text.decoded(result, self.ramcode))
+
+	def encoder(self, address, value, condition):
+		self.ramcode = False
+
+		result = codec.encode(self.mode, int(address, 16), int(value, 16), int(condition, 16) if condition else None)
+		if result.ram: self.ram_code('Encode')
+		print(text.encoded(result, self.ramcode))
+
+class SNESMega(GBGear):
+	def __init__(self, mode = 'snes'):
+		GBGear.__init__(self, mode)
+
+	# SNES codes that aren't hexadecimal are just invalid here
+	def no_hex_code(self):
+		self.invalid_code()
+
+# the class that talks to the user, by Platform.family
+INTERFACES = {'nes': NES, 'gb': GBGear, 'eight': SNESMega}
+
+# Windows 10+ consoles understand the same escape codes once virtual terminal processing is on
+def enable_vt():
+	import ctypes
+	kernel32 = ctypes.windll.kernel32
+	handle = kernel32.GetStdHandle(-11) # STD_OUTPUT_HANDLE
+	mode = ctypes.c_uint32()
+	if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)): return False
+	if mode.value & 4: return True # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+	return bool(kernel32.SetConsoleMode(handle, mode.value | 4))
+
+ansi = None # whether the console takes escape codes, found out on the first clear()
 
 # you don't mind this clear function in almost every console python script by me, eh?
+# (no more shelling out to cls/clear, and nothing to clear if the output isn't a console;
+# older Windows consoles without escape codes just don't get cleared)
 def clear():
-	done = False
-	while not done:
-		try:
-			if os.name == 'nt':
-				_ = os.system('cls')
-			else:
-				_ = os.system('clear')
-			done = True
-		except:
-			pass
-
-def quitter():
-	if not args.autoexit:
+	global ansi
+	if args.headless or not sys.stdout.isatty(): return
+	if ansi is None: ansi = os.name != 'nt' or enable_vt()
+	if ansi: print('\033[H\033[2J\033[3J', end = '', flush = True)
+
+def set_title(title):
+	if args.headless or not sys.stdout.isatty(): return
+	if os.name == 'nt':
+		import ctypes
+		ctypes.windll.kernel32.SetConsoleTitleW(title)
+	else:
+		print('\033]0;' + title + '\007', end = '', flush = True)
+
+# one key press (one line where there is no msvcrt), as bytes
+def getch():
+	if os.name == 'nt':
+		import msvcrt
+		return msvcrt.getche()
+	try: return input()[:1].encode()
+	except EOFError: return b''
+
+def quitter(status = 0):
+	if not args.autoexit and not args.headless:
 		print('\nPress Enter 10 times to exit! If that\'s too much Enter presses for you, you can CTRL+C/CTRL+BREAK to skip it.', end = '')
 		try:
 			input()
@@ -439,10 +151,10 @@ def quitter():
 		except EOFError:
 			pass
 		clear()
-	exit()
+	sys.exit(status)
 
 def logo():
-	if not args.nologo:
+	if not args.nologo and not args.headless:
 		try:
 			print('  _____  _______          __        _        _\n\
  / ____|/ ____\\ \\        / /       | |      | |\n\
@@ -457,41 +169,169 @@ def logo():
 		except:
 			pass
 
-try:
-	clear()
-	logo()
-	clear()
+def open_input(path):
+	if path == '-': return sys.stdin
+	try: return open(path, errors = 'replace')
+	except OSError as e: parser.error(str(e))
+
+# writes batch/search rows to stdout in the format picked with -f and exits
+def write_rows(rows, status = 0):
+	from ggworkshop import batch
+	try:
+		if args.format in batch.BINARY:
+			batch.WRITERS[args.format](rows, sys.stdout.buffer)
+			sys.stdout.buffer.flush()
+		else:
+			batch.WRITERS[args.format](rows, sys.stdout)
+			sys.stdout.flush()
+	except BrokenPipeError:
+		# the reader went away (e.g. piped into head), that's fine
+		os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+	except OSError as e:
+		parser.error(str(e))
+	except KeyboardInterrupt:
+		pass
+	sys.exit(status)
+
+if __name__ == '__main__':
+	args = parser.parse_args()
+	if args.ram is None: args.ram = 'flag' if args.ramcode or args.headless else 'prompt'
+	if args.format is None: args.format = 'text' if args.option in ('encode', 'decode', 'audit') else 'csv'
+	elif args.format == 'text' and args.option not in ('encode', 'decode', 'audit'):
+		parser.error('"text" format can only be used with "encode", "decode" and "audit" options')
+	if args.platform == 'auto' and (args.option == 'encode' or args.option == 'search'):
+		parser.error('"auto" platform can only be used with "decode", "batch", "serve" and "audit" options')
+	if args.option == 'encode':
+		if not args.value:
+			parser.error('the following arguments are required when using "encode" option: <value>')
+
+	# the digit counts and ranges come from the platform's codec
+	if args.option == 'encode':
+		from ggworkshop import batch
+		try:
+			address = batch.parse_hex(args.address, codec.ADDRESS_DIGITS[args.platform], 'address')
+			value = batch.parse_hex(args.value, codec.VALUE_DIGITS[args.platform], 'value')
+			condition = batch.parse_hex(args.condition, 2, 'condition') if args.condition else None
+			codec.get(args.platform).check(address, value, condition)
+		except ValueError as e: parser.error(str(e))
+
+	# use the precomputed lookup tables if they have been built (python -m ggworkshop.tables),
+	# not worth opening for a single code
+	if args.option != 'encode' and args.option != 'decode':
+		from ggworkshop import tables
+		tables.install()
+
+	# both report when the program exits, whichever way it does
+	if args.stats or os.environ.get('GGWORKSHOP_STATS', '0') != '0':
+		import atexit
+		from ggworkshop import instrument
+		instrument.enable()
+		atexit.register(lambda: sys.stderr.write(instrument.report()))
+	if args.profile:
+		import atexit
+		import cProfile
+		profiler = cProfile.Profile()
+		atexit.register(lambda: (profiler.disable(), profiler.dump_stats(args.profile)))
+		profiler.enable()
+
+	option = args.option
+	platform = args.platform
+	if option == 'encode':
+		address = args.address
+		value = args.value
+		if args.condition: condition = args.condition
+		else: condition = ''
+	elif option == 'decode':
+		code = args.address
+		if platform == 'auto':
+			platform = codec.detect(code)
+			if platform is None: parser.error('this isn\'t a Game Genie code for any platform: ' + code)
+	elif option == 'batch':
+		from ggworkshop import batch
+		if args.cache < 0: parser.error('the cache size can\'t be negative')
+		if args.jobs is None:
+			from ggworkshop import cache
+			results = cache.Cache(args.cache) if args.cache else None
+			process = lambda platform, lines: batch.process(platform, lines, cache = results)
+		else:
+			if args.jobs < 0: parser.error('the number of jobs can\'t be negative')
+			from ggworkshop import parallel
+			process = lambda platform, lines: parallel.process(platform, lines, args.jobs or None, cache_size = args.cache)
+
+		write_rows(process(platform, open_input(args.address)))
+	elif option == 'audit':
+		import json
+		from ggworkshop import audit, batch, cache
+		if args.cache < 0: parser.error('the cache size can\'t be negative')
+		checker = audit.Audit(platform, cache.Cache(args.cache) if args.cache else None)
+		rows = checker.run(open_input(args.address))
+		try:
+			if args.format == 'text': audit.write_text(checker, rows, sys.stdout)
+			else:
+				audit.WRITERS[args.format](rows, sys.stdout.buffer if args.format in batch.BINARY else sys.stdout)
+				# the output is for programs, the totals go to stderr
+				print(json.dumps(checker.summary()), file = sys.stderr)
+			sys.stdout.flush()
+		except BrokenPipeError:
+			os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+		except KeyboardInterrupt:
+			pass
+		sys.exit()
+	elif option == 'serve':
+		from ggworkshop import server
+		if args.concurrency < 1: parser.error('the concurrency limit must be at least 1')
+		if args.cache < 0: parser.error('the cache size can\'t be negative')
+		try: server.serve(args.address, platform, args.concurrency, server.listening, args.cache)
+		except (OSError, ValueError) as e: parser.error(str(e))
+		exit()
+	elif option == 'search':
+		from ggworkshop import batch, search
+		try:
+			first, last = search.parse_hex_range(args.address, codec.ADDRESS_DIGITS[platform], 'address')
+			values = search.parse_hex_set(args.value, codec.VALUE_DIGITS[platform], 'value') if args.value else None
+			conditions = search.parse_hex_set(args.condition, 2, 'condition') if args.condition else None
+		except ValueError as e: parser.error(str(e))
+
+		try:
+			if args.input: results = search.filter_codes(platform, open_input(args.input), first, last, values, conditions)
+			else: results = search.encode_range(platform, first, last, values, conditions, codec.LENGTHS[platform][-1 if args.long or conditions else 0])
+		except ValueError as e: parser.error(str(e))
+
+		if args.input: write_rows(batch.decoded_row(number, result.code, result) for number, result in enumerate(results, 1))
+		else: write_rows(batch.encoded_row(number, None, result) for number, result in enumerate(results, 1))
+
+	# the same rows the "batch" option writes, nothing else
+	if args.format != 'text':
+		from ggworkshop import batch
+		if option == 'decode': row = batch.decode_row(platform, 1, code)
+		else: row = batch.encode_row(platform, 1, [address, value] + ([condition] if condition else []))
+		result = row[4]
+		write_rows([row], 1 if result is None or args.ram == 'deny' and result.ram else 0)
+
+	set_title('GGWorkshop by GamingWithEvets v.' + version)
+
+	try:
+		clear()
+		logo()
+		clear()
 	
-	if platform == 'nes':
-		ggnes = NES()
-		if option == 'decode':
-			ggnes.decoder(code)
-		elif option == 'encode':
-			ggnes.encoder(address, value, condition)
-	elif platform == 'gb':
-		gggb = GBGear()
+		gg = INTERFACES[codec.get(platform).family](platform)
 		if option == 'decode':
-			gggb.decoder(code)
+			gg.decoder(code)
 		elif option == 'encode':
-			print('Generating Nintendo Game Boy Game Genie codes is not supported at the moment.\nPlease go to https://github.com/gamingwithevets/ggworkshop/releases\nto check for updates!')
-	elif platform == 'gear':
-		gggear = GBGear('gear')
-		if option == 'decode':
-			gggear.decoder(code)
-		elif option == 'encode':
-			print('Generating Sega Game Gear Game Genie codes is not supported at the moment.\nPlease go to https://github.com/gamingwithevets/ggworkshop/releases\nto check for updates!'.format(version))
-	else:
-		print('This platform is not supported at the moment.\nPlease go to https://github.com/gamingwithevets/<repo name here>/releases\nto check for updates!')
+			gg.encoder(address, value, condition)
 
-except KeyboardInterrupt:
-	print('\nCTRL+C/CTRL+BREAK hotkey detected! Breaking program.')
-	print(traceback.format_exc())
-	print('If the traceback shows an error, please report it to https://github.com/gamingwithevets/<repo name here>/issues\nif possible.')
-	quitter()
-except Exception:
-	print('\nAn error has occurred!')
-	print(traceback.format_exc())
-	print('If possible, please report it to https://github.com/gamingwithevets/<repo name here>/issues')
-	quitter()
+	except KeyboardInterrupt:
+		print('\nCTRL+C/CTRL+BREAK hotkey detected! Breaking program.')
+		import traceback
+		print(traceback.format_exc())
+		print('If the traceback shows an error, please report it to https://github.com/gamingwithevets/<repo name here>/issues\nif possible.')
+		quitter()
+	except Exception:
+		print('\nAn error has occurred!')
+		import traceback
+		print(traceback.format_exc())
+		print('If possible, please report it to https://github.com/gamingwithevets/<repo name here>/issues')
+		quitter(1)
 
-quitter()
\ No newline at end of file
+	quitter()
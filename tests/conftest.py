@@ -0,0 +1,7 @@
+import os
+import sys
+
+# the tests run against the tree they're in, like the benchmarks
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+sys.path.insert(0, os.path.join(root, 'benchmarks'))
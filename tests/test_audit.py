@@ -0,0 +1,46 @@
+import io
+
+from ggworkshop import audit, batch
+
+LINES = ['SXIOPO', 'WALNUT', 'AALNUT', '00A-17B-C49', 'AAAAAAAA', 'ZZZ', '', '120-003', 'sxiopo']
+
+def test_categories():
+	checker = audit.Audit('auto')
+	rows = list(checker.run(LINES))
+	assert [(row.line, row.categories, row.duplicate_of) for row in rows] == [
+		(1, (), None),
+		(2, ('invalid',), None),
+		(3, ('duplicate',), 2), # WALNUT's replacement
+		(4, (), None),
+		(5, ('useless',), None),
+		(6, ('rejected',), None),
+		(8, ('ram',), None),
+		(9, ('duplicate',), 1)
+	]
+	assert rows[5].error == 'not a Game Genie code for any platform'
+	assert checker.summary() == {'codes': 8, 'distinct': 5, 'ok': 2, 'categories': {'rejected': 1, 'invalid': 1, 'ram': 1, 'useless': 1, 'duplicate': 2}, 'platforms': {'nes': 5, 'gb': 2}}
+
+def test_one_platform():
+	rows = list(audit.Audit('gb').run(['SXIOPO', '00A-17B']))
+	assert rows[0].categories == ('rejected',)
+	assert rows[1].categories == ()
+
+def test_bin_flags():
+	out = io.BytesIO()
+	audit.write_bin(audit.Audit('auto').run(LINES), out)
+	data = out.getvalue()
+	flags = [batch.RECORD.unpack_from(data, offset)[7] for offset in range(0, len(data), batch.RECORD.size)]
+	assert flags == [0, 1, audit.DUPLICATE, 0, audit.USELESS, batch.ERROR, 2, audit.DUPLICATE]
+
+def test_text():
+	checker = audit.Audit('auto')
+	out = io.StringIO()
+	audit.write_text(checker, checker.run(LINES), out)
+	text = out.getvalue()
+	assert text.startswith('Audited 8 codes, 5 distinct.\n')
+	assert '  line 3: AALNUT (same as line 2)\n' in text
+	assert '  line 2: WALNUT (use AALNUT)\n' in text
+
+def test_mega_ram():
+	rows = list(audit.Audit('mega').run(['9999-9999', 'AD9X-8AH9']))
+	assert [row.categories for row in rows] == [('ram',), ()]
@@ -0,0 +1,51 @@
+import io
+
+from ggworkshop import batch, cache
+
+def errors(platform, lines):
+	return [(row[0], row[4] is None, row[5]) for row in batch.process(platform, lines)]
+
+def test_error_rows():
+	lines = ['ZZZ', '', '8000 00 00 00', 'GGGG 00', '7FFF 00', '8000 0', 'SXIOPO']
+	assert errors('nes', lines) == [
+		(1, True, 'NES Game Genie codes are 6 or 8 letters long'),
+		(3, True, 'too many fields'),
+		(4, True, 'invalid hex address: GGGG'),
+		(5, True, 'address must be between $8000 and $FFFF'),
+		(6, True, 'hex value must be 2 digits: 0'),
+		(7, False, None)
+	]
+
+def test_auto():
+	assert errors('auto', ['ZZZ', '8000 00', 'DD32-6DAD']) == [
+		(1, True, 'not a Game Genie code for any platform'),
+		(2, True, 'the platform has to be given to encode codes'),
+		(3, False, None)
+	]
+	assert batch.decode_row('auto', 1, 'DD32-6DAD')[2] == 'snes'
+
+def test_mega_range():
+	assert batch.encode_row('mega', 1, ['3FFFFF', '0000'])[5] is None
+	assert batch.encode_row('mega', 1, ['400000', '0000'])[5] == 'address must be between $000000 and $3FFFFF'
+
+def test_cache_rows():
+	results = cache.Cache(16)
+	lines = ['SXIOPO', 'ZZZ', 'C000 09 01']
+	assert list(batch.process('nes', lines, cache = results)) == list(batch.process('nes', lines))
+	list(batch.process('nes', lines, cache = results))
+	assert results.hits == 2
+
+def test_writers():
+	rows = list(batch.process('nes', ['SXIOPO', 'ZZZ']))
+	out = io.StringIO()
+	batch.write_csv(rows, out)
+	assert out.getvalue().splitlines() == [
+		','.join(batch.FIELDS),
+		'1,decode,nes,SXIOPO,SXIOPO,,91D9,AD,,False,,False,',
+		'2,decode,nes,ZZZ,,,,,,,,,NES Game Genie codes are 6 or 8 letters long'
+	]
+
+	out = io.BytesIO()
+	batch.write_bin(rows, out)
+	records = [batch.RECORD.unpack_from(out.getvalue(), offset) for offset in range(0, len(out.getvalue()), batch.RECORD.size)]
+	assert [(record[1], record[7]) for record in records] == [(1, 0), (2, batch.ERROR)]
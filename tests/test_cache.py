@@ -0,0 +1,37 @@
+import pytest
+
+from ggworkshop import cache, codec
+
+def test_counters():
+	results = cache.Cache(2)
+	results.decode('nes', 'SXIOPO') # miss
+	assert results.decode('nes', 'sxiopo') is results.decode('nes', 'SXIOPO') # two hits, the same key
+	results.encode('nes', 0x91D9, 0xAD) # miss
+	results.decode('gb', '00A-17B') # miss, SXIOPO goes
+	results.decode('nes', 'SXIOPO') # miss again, the encode goes
+
+	stats = results.stats()
+	assert (stats['hits'], stats['misses'], stats['evictions'], stats['entries']) == (2, 4, 2, 2)
+	assert stats['hit_rate'] == 2 / 6
+
+def test_same_results():
+	results = cache.Cache(4)
+	assert results.decode('nes', 'SXIOPO') == codec.decode('nes', 'SXIOPO')
+	assert results.encode('gb', 0xA17B, 0) == codec.encode('gb', 0xA17B, 0)
+
+def test_invalid_codes_not_kept():
+	results = cache.Cache(4)
+	for i in range(2):
+		with pytest.raises(codec.InvalidCode): results.decode('nes', 'ZZZ')
+	assert len(results) == 0
+	assert results.stats()['misses'] == 2
+
+def test_resize_and_clear():
+	results = cache.Cache(4)
+	for code in ('AAAAAA', 'PAAAAA', 'ZAAAAA'):
+		results.decode('nes', code)
+	results.resize(1)
+	assert (len(results), results.evictions) == (1, 2)
+	results.clear()
+	assert results.stats()['evictions'] == 0
+	with pytest.raises(ValueError): cache.Cache(0)
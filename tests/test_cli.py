@@ -0,0 +1,59 @@
+# python -m ggworkshop has to print exactly what main.py -H does, and exit with the same status
+
+import os
+import sys
+import subprocess
+
+import pytest
+
+from conftest import root
+from ggworkshop import __main__
+
+COMMANDS = [
+	'decode nes SXIOPO -f csv',
+	'decode nes SXIOPOZA -f json',
+	'decode gb 00A-17B-C49 -f bin',
+	'decode auto DD32-6DAD -f csv',
+	'decode auto ZZZ -f csv',
+	'decode nes WALNUT -f json',
+	'decode gb 120-003 -f csv -R deny',
+	'decode gb 120-003 -f csv -R allow',
+	'encode nes 91D9 AD -f csv',
+	'encode gb A17B 00 C4 -f json',
+	'encode mega 3FFFFF 0000 -f bin',
+	'encode mega 400000 0000 -f csv',
+	'encode nes 7FFF 00 -f csv',
+	'encode snes 7E0000 00 01 -f csv',
+	'decode nes SXIOPO',
+	'decode nes WALNUT',
+	'decode nes ZZZ',
+	'decode gb 120-003',
+	'decode gb 120-003 -R deny',
+	'decode gear 00A-17B-C4A -f text',
+	'decode mega 9999-9999',
+	'decode auto DD32-6DAD',
+	'encode nes 8000 01 01',
+	'encode gb C000 56 -R allow',
+	'encode mega 000000 abcd'
+]
+
+def run(argv):
+	env = dict(os.environ)
+	env.pop('GGWORKSHOP_STATS', None)
+	return subprocess.run([sys.executable] + argv, cwd = root, env = env, stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+
+@pytest.mark.parametrize('command', COMMANDS)
+def test_parity(command):
+	args = command.split()
+	main = run(['main.py'] + args + ['-H'])
+	fast = run(['-m', 'ggworkshop'] + args + ['-H'])
+	assert (fast.stdout, fast.returncode) == (main.stdout, main.returncode)
+
+def test_fallback():
+	# errors are main.py's to print
+	assert __main__.fast(['encode', 'mega', '400000', '0000', '-f', 'csv']) is None
+	assert __main__.fast(['encode', 'nes', '8000', '0', '-f', 'csv']) is None
+	assert __main__.fast(['decode', 'auto', 'ZZZ', '-f', 'csv']) is None
+	assert __main__.fast(['decode', 'nes', 'SXIOPO']) is None # text without -H
+	assert __main__.fast(['decode', 'gb', '120-003', '-H', '-R', 'prompt']) is None
+	assert __main__.fast(['batch', 'nes', 'codes.txt', '-f', 'csv']) is None
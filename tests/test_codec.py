@@ -0,0 +1,69 @@
+# a quick version of benchmarks/golden.py: a sample of codes checked against its reference
+# decoders instead of the whole code spaces
+
+import random
+
+import golden
+from ggworkshop import codec
+
+COUNT = 5000
+
+def numbers(bits):
+	rng = random.Random(golden.SEED)
+	return [rng.getrandbits(bits) for i in range(COUNT)]
+
+def test_nes_decode():
+	for n in numbers(24):
+		assert codec.nes_decode6(n) == golden.reference_nes(n, 6)
+	for n in numbers(32):
+		assert codec.nes_decode8(n) == golden.reference_nes(n, 8)
+
+def test_gb_decode():
+	for n in numbers(24):
+		assert codec.gb_decode6(n) == golden.reference_gb(n, 6)
+	for n in numbers(36):
+		assert codec.gb_decode9(n) | (n != codec.gb_fix9(n)) << 32 == golden.reference_gb(n, 9)
+
+def test_nes_encode():
+	for key in numbers(32):
+		address, value, condition = 0x8000 | key >> 16 & 0x7FFF, key & 255, key >> 8 & 255
+		n = codec.nes_encode6(address, value)
+		# the encoder gives the code with the third letter's high bit clear
+		assert not n & 0x8000
+		assert golden.reference_nes(n, 6) == address << 8 | value
+		assert golden.reference_nes(codec.nes_encode8(address, value, condition), 8) == address << 16 | condition << 8 | value
+
+def test_gb_encode():
+	for key in numbers(32):
+		address, value, condition = key >> 16, key & 255, key >> 8 & 255
+		assert golden.reference_gb(codec.gb_encode6(address, value), 6) == address << 8 | value
+		assert golden.reference_gb(codec.gb_encode9(address, value, condition), 9) == address << 16 | condition << 8 | value
+
+def test_api():
+	assert codec.decode('nes', 'SXIOPO').hex() == ('91D9', 'AD', None)
+	assert codec.decode('gb', '00A-17B-C49').hex() == ('4A17', '00', 'C8')
+	assert codec.encode('nes', 0x91D9, 0xAD).codes == ('SXIOPO', 'SXSOPO')
+	assert codec.detect('DD32-6DAD') == 'snes'
+	assert codec.detect('ZZZ') is None
+
+# above the cartridge ROM, which encode() won't go to
+def test_mega_ram():
+	assert codec.decode('mega', '9999-9999').address == 0xFFFFFF
+	assert codec.decode('mega', '9999-9999').ram
+	assert not codec.decode('mega', codec.encode('mega', 0x3FFFFF, 0).code).ram
+
+def test_register():
+	class Other(codec.SNESPlatform):
+		name = 'other'
+		title = short_title = 'Other'
+		detect_order = -1
+
+	codec.register(Other())
+	try:
+		assert codec.DETECT == ['other', 'nes', 'gb', 'snes', 'mega']
+		assert codec.detect('DD32-6DAD') == 'other'
+		assert codec.decode('other', 'DD32-6DAD').hex() == codec.decode('snes', 'DD32-6DAD').hex()
+	finally:
+		for names in (codec.PLATFORMS, codec.NAMES, codec.SHORT_NAMES, codec.LENGTHS, codec.ADDRESS_DIGITS, codec.VALUE_DIGITS):
+			del names['other']
+		codec.DETECT.remove('other')
@@ -0,0 +1,20 @@
+import pytest
+
+from ggworkshop import audit, batch, cache, instrument
+
+@pytest.fixture
+def stats():
+	instrument.enable()
+	instrument.reset()
+	yield
+	instrument.disable()
+
+# every row once, whether the result came from the cache or detect() had to try several platforms
+def test_counted_per_row(stats):
+	results = cache.Cache(16)
+	list(batch.process('auto', ['SXIOPO', 'SXIOPO', 'SXIOPO', 'ZZZ', 'WALNUT', '120-003'], cache = results))
+	list(batch.process('nes', ['8000 00', 'GGGG 00'], cache = results))
+	list(audit.Audit('auto', results).run(['SXIOPO', 'ZZZ']))
+
+	counters = instrument.snapshot()['counters']
+	assert counters == {'decoded': 6, 'encoded': 1, 'rejected': 3, 'invalid_letters': 1, 'check_failures': 0, 'ram': 1}
@@ -0,0 +1,22 @@
+import pytest
+
+from ggworkshop import batch, codec, parallel
+
+def test_process():
+	lines = ['SXIOPO', 'ZZZ', 'C000 09 01'] * 5
+	assert list(parallel.process('nes', lines, jobs = 2, chunk_size = 4)) == list(batch.process('nes', lines))
+
+def test_encode_space():
+	rows = list(parallel.encode_space('nes', 0x8000, 0x8001, jobs = 1))
+	assert len(rows) == 2 * 256
+	assert rows[1] == (0x8000, 1, None, codec.encode('nes', 0x8000, 1).code)
+
+# 16-bit values, all of them
+def test_encode_space_mega():
+	rows = list(parallel.encode_space('mega', 0x3FFFFF, 0x3FFFFF, jobs = 1))
+	assert [row[1] for row in rows] == list(range(0x10000))
+	assert rows[-1] == (0x3FFFFF, 0xFFFF, None, codec.encode('mega', 0x3FFFFF, 0xFFFF).code)
+
+def test_encode_space_conditions():
+	with pytest.raises(ValueError, match = 'cannot have a condition'): parallel.encode_space('snes', 0, 0, conditions = True)
+	with pytest.raises(codec.UnsupportedPlatform): parallel.encode_space('psx', 0, 0)
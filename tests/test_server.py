@@ -0,0 +1,58 @@
+# raw requests against a Server on a local port, so broken ones can be sent too
+
+import json
+import asyncio
+
+from ggworkshop import server
+
+def request(handler, data):
+	async def send():
+		listener = await asyncio.start_server(handler.handle, '127.0.0.1', 0)
+		async with listener:
+			reader, writer = await asyncio.open_connection(*listener.sockets[0].getsockname()[:2])
+			writer.write(data)
+			await writer.drain()
+			answer = await reader.read() # everything until the server closes the connection
+			writer.close()
+		return answer
+
+	head, sep, body = asyncio.run(send()).partition(b'\r\n\r\n')
+	lines = head.decode().split('\r\n')
+	headers = dict(line.lower().split(': ', 1) for line in lines[1:])
+	return int(lines[0].split()[1]), headers['connection'], json.loads(body)
+
+def post(handler, path, payload):
+	body = json.dumps(payload).encode()
+	return request(handler, 'POST {0} HTTP/1.1\r\nContent-Length: {1}\r\nConnection: close\r\n\r\n'.format(path, len(body)).encode() + body)
+
+def test_decode():
+	status, connection, answer = post(server.Server('nes'), '/decode', {'code': 'SXIOPO'})
+	assert status == 200
+	assert (answer['address'], answer['value']) == ('91D9', 'AD')
+
+def test_bad_platform():
+	for platform in (['nes'], {'name': 'nes'}, 1, None):
+		status, connection, answer = post(server.Server(), '/decode', {'platform': platform, 'code': 'SXIOPO'})
+		assert (status, answer) == (400, {'error': 'the platform must be a string'})
+	status, connection, answer = post(server.Server(), '/encode', {'platform': 'psx', 'address': '8000', 'value': '00'})
+	assert (status, answer) == (400, {'error': 'unknown platform: \'psx\''})
+
+def test_bad_requests():
+	for path, payload in (('/decode', {'codes': 'SXIOPO'}), ('/decode', {'code': 1}), ('/encode', {'rows': [{'address': '8000'}]}), ('/encode', {'address': 8000, 'value': '00'})):
+		assert post(server.Server('nes'), path, payload)[0] == 400
+	assert post(server.Server(), '/', {})[0] == 405
+	assert post(server.Server(), '/nothing', {})[0] == 404
+
+def test_negative_length():
+	status, connection, answer = request(server.Server(), b'POST /decode HTTP/1.1\r\nContent-Length: -5\r\n\r\n')
+	assert (status, connection, answer) == (400, 'close', {'error': 'bad Content-Length'})
+
+def test_internal_error(capsys):
+	handler = server.Server('nes')
+	async def broken(payload): raise RuntimeError('a bug')
+	handler.decode = broken
+	# keep-alive is asked for, but after a 500 the connection is closed
+	body = b'{"code": "SXIOPO"}'
+	status, connection, answer = request(handler, b'POST /decode HTTP/1.1\r\nContent-Length: 18\r\n\r\n' + body)
+	assert (status, connection, answer) == (500, 'close', {'error': 'internal server error'})
+	assert 'RuntimeError: a bug' in capsys.readouterr().err